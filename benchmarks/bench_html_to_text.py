@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: html_to_text vs. BeautifulSoup for feed summaries (synthetic feed fixtures in benchmarks/fixtures).
+Usage: python benchmarks/bench_html_to_text.py [--repeat 5]
+"""
+
+import argparse
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+# Run from project directory (models/ and the learning database are relative)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(BASE_DIR, 'benchmarks', 'fixtures')
+os.chdir(BASE_DIR)
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault("FAKE_NEWS_FAST_START", "1")
+
+# Keep the startup banner out of the benchmark output
+with contextlib.redirect_stdout(io.StringIO()):
+    import clean_app
+
+
+def best_time(fn, repeat):
+    """Return the fastest wall time of `repeat` runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def soup_text(markup):
+    """The previous per-summary stage"""
+    return clean_app.BeautifulSoup(markup, 'html.parser').get_text()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'fixture':<22} {'entries':>7} {'soup/s':>10} {'fast/s':>10} {'speedup':>8} {'same text':>10}"
+          f" {'parse+soup/s':>13} {'parse+fast/s':>13}")
+
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.xml'))):
+        with open(path, 'rb') as f:
+            content = f.read()
+        summaries = [entry.get('summary', '') for entry in clean_app.feedparser.parse(content).entries]
+        n = len(summaries)
+
+        soup = best_time(lambda: [soup_text(s) for s in summaries], args.repeat)
+        fast = best_time(lambda: [clean_app.html_to_text(s) for s in summaries], args.repeat)
+        same = sum(' '.join(soup_text(s).split()) == ' '.join(clean_app.html_to_text(s).split()) for s in summaries)
+
+        # Whole feed stage (feedparser + cleanup), old vs. new
+        parse_fast = best_time(lambda: clean_app.parse_feed_entries(content), args.repeat)
+        original = clean_app.html_to_text
+        clean_app.html_to_text = soup_text
+        try:
+            parse_soup = best_time(lambda: clean_app.parse_feed_entries(content), args.repeat)
+        finally:
+            clean_app.html_to_text = original
+
+        print(f"{os.path.basename(path):<22} {n:>7} {n / soup:>10.0f} {n / fast:>10.0f} {soup / fast:>7.1f}x"
+              f" {same:>5}/{n:<4} {n / parse_soup:>13.0f} {n / parse_fast:>13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: live-feed insert throughput and recall of the MinHash/LSH near-duplicate index.
+Near-duplicates are edited until their difflib ratio to the stored item falls in (0.75, 0.85].
+Usage: python benchmarks/bench_near_dup.py [--sizes 2000,20000,200000] [--inserts 500] [--legacy-samples 2]
+"""
+
+import argparse
+import contextlib
+import difflib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Run from project directory (models/ and the learning database are relative)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(BASE_DIR)
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault("FAKE_NEWS_FAST_START", "1")
+
+# Keep the startup banner out of the benchmark output
+with contextlib.redirect_stdout(io.StringIO()):
+    import clean_app
+
+
+def make_vocabulary(rng, size=3000):
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    return [''.join(rng.choice(letters) for _ in range(rng.randint(3, 10))) for _ in range(size)]
+
+
+def make_headline(rng, vocab):
+    """Headline-sized synthetic text (unrelated headlines share few shingles)"""
+    words = [rng.choice(vocab) for _ in range(rng.randint(15, 30))]
+    return ' '.join(words).capitalize() + '.'
+
+
+def ratio(a, b):
+    return difflib.SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
+
+
+def near_duplicate(rng, vocab, text, low=0.75, high=0.85):
+    """
+    Same story, edited until its difflib ratio drops into (low, high] - the pairs the old
+    scan rejected with the least margin. Half get word edits (rewrites), half scattered
+    character edits (typos / transliteration), the hardest case for shingles.
+    """
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    while True:
+        by_word = rng.random() < 0.5
+        parts = text.split() if by_word else list(text)
+        for _ in range(500):
+            i = rng.randrange(len(parts))
+            new = rng.choice(vocab) if by_word else rng.choice(letters)
+            op = rng.random()
+            if op < 0.5:
+                parts[i] = new
+            elif op < 0.75:
+                parts.insert(i, new)
+            elif len(parts) > 5:
+                del parts[i]
+            candidate = (' ' if by_word else '').join(parts)
+            r = ratio(text, candidate)
+            if r <= high:
+                if r > low:
+                    return candidate
+                break  # Overshot - start again
+
+
+def legacy_scan(conn, text):
+    """The old per-insert check: difflib against every stored item"""
+    text_lower = text.lower().strip()
+    for row in conn.execute('SELECT text FROM samples'):
+        if difflib.SequenceMatcher(None, row['text'].lower().strip(), text_lower).ratio() > clean_app.NEAR_DUP_THRESHOLD:
+            return True
+    return False
+
+
+def fill(conn, rng, vocab, target):
+    """Bulk-insert synthetic rows until the database holds `target` items"""
+    count = conn.execute('SELECT COUNT(*) FROM samples').fetchone()[0]
+    with conn:
+        for _ in range(target - count):
+            text = make_headline(rng, vocab)
+            clean_app._insert_sample(conn, text, 'Bootstrap Data', 0.9, None, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', default='2000,20000,200000')
+    parser.add_argument('--inserts', type=int, default=500)
+    parser.add_argument('--legacy-samples', type=int, default=2,
+                        help='inserts timed with the old full difflib scan (0 = skip)')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    vocab = make_vocabulary(rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clean_app.LEARNING_DB_PATH = os.path.join(tmp, 'bench.sqlite3')
+        clean_app.LEARNING_DB_MAX_ITEMS = 10 ** 9
+        conn = clean_app.get_learning_db()
+
+        print(f"LSH: {clean_app.LSH_BANDS} bands x {clean_app.LSH_ROWS} rows, {clean_app.SHINGLE_SIZE}-char shingles, "
+              f"threshold {clean_app.NEAR_DUP_THRESHOLD}\n")
+        print(f"{'rows':>8}  {'LSH inserts/s':>14}  {'near-dups caught':>16}  {'recall':>7}  {'new rejected':>12}"
+              f"  {'legacy inserts/s':>16}")
+        for size in (int(s) for s in args.sizes.split(',')):
+            fill(conn, rng, vocab, size)
+            stored = [row['text'] for row in conn.execute(
+                'SELECT text FROM samples ORDER BY RANDOM() LIMIT ?', (args.inserts // 2,))]
+
+            # Half new stories, half near-duplicates of stored ones
+            batch = [(make_headline(rng, vocab), False) for _ in range(args.inserts - len(stored))]
+            batch += [(near_duplicate(rng, vocab, text), True) for text in stored]
+            rng.shuffle(batch)
+
+            start = time.perf_counter()
+            added = [clean_app.add_to_learning_database(text, 1, 'BBC Live', 0.9) for text, _ in batch]
+            lsh_rate = len(batch) / (time.perf_counter() - start)
+            caught = sum(not ok for ok, (_, dup) in zip(added, batch) if dup)
+            new_rejected = sum(not ok for ok, (_, dup) in zip(added, batch) if not dup)
+
+            legacy = '-'
+            if args.legacy_samples:
+                start = time.perf_counter()
+                for _ in range(args.legacy_samples):
+                    legacy_scan(conn, make_headline(rng, vocab))
+                legacy = f"{args.legacy_samples / (time.perf_counter() - start):.2f}"
+
+            print(f"{size:>8}  {lsh_rate:>14.1f}  {caught:>10}/{len(stored):<5}  {caught / len(stored):>7.1%}"
+                  f"  {new_rejected:>12}  {legacy:>16}")
+
+
+if __name__ == "__main__":
+    main()
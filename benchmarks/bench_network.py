@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: feed, Wikipedia and Groq paths against fake_servers.py (no internet or API key needed).
+Usage: python benchmarks/bench_network.py [--latency 100] [--error-rate 0] [--rate-limit-rate 0.1] [--claims 40]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Run from project directory (models/ and the learning database are relative)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(BASE_DIR)
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault("FAKE_NEWS_FAST_START", "1")
+os.environ.setdefault("FAKE_NEWS_GROQ_RPM", "6000")  # Measure the server, not the client-side limit
+
+import fake_servers
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--latency', type=float, default=100, help='ms per request')
+    parser.add_argument('--jitter', type=float, default=0.5)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit-rate', type=float, default=0.1)
+    parser.add_argument('--claims', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    server, base_url = fake_servers.start_server(latency=args.latency / 1000, jitter=args.jitter,
+                                                 error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+                                                 retry_after=0, seed=args.seed)
+    # The app reads its endpoints at import time
+    os.environ['FAKE_NEWS_GROQ_URL'] = f"{base_url}/openai/v1/chat/completions"
+    os.environ['FAKE_NEWS_WIKI_URL'] = f"{base_url}/w/api.php"
+    os.environ['FAKE_NEWS_FEED_BASE_URL'] = base_url
+    os.environ['FAKE_NEWS_WIKI_BACKEND'] = 'online'
+
+    # Keep the startup banner out of the benchmark output
+    with contextlib.redirect_stdout(io.StringIO()):
+        import clean_app
+
+    def stats():
+        return dict(server.stats)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        clean_app.CACHE_DB_PATH = os.path.join(tmp, 'cache.sqlite3')
+        clean_app.LEARNING_DB_PATH = os.path.join(tmp, 'learning.sqlite3')
+        clean_app._groq_api_key = 'fake-key'
+
+        print(f"Fake servers: {base_url} (latency {args.latency:.0f}ms ±{args.jitter:.0%}, "
+              f"503 {args.error_rate:.0%}, 429 {args.rate_limit_rate:.0%})\n")
+
+        # Feeds: cold fetch, then conditional GETs answered 304
+        urls = clean_app.feed_urls(clean_app.LIVE_NEWS_FEEDS)
+        entries = []
+        for label in ('cold', 'warm (304)'):
+            start = time.perf_counter()
+            results = list(clean_app.fetch_feeds(urls, 40))
+            elapsed = time.perf_counter() - start
+            entries = [entry for _, feed_entries, error in results if error is None for entry in feed_entries]
+            failed = sum(error is not None for _, _, error in results)
+            print(f"feeds {label:<12} {len(urls)} feeds  {elapsed * 1000:7.0f} ms  "
+                  f"{len(entries)} entries  {failed} failed")
+
+        # Wikipedia: one batched request per text, then the keyword cache
+        texts = [f"{entry['title']}. {entry['summary']}" for entry in entries][:args.claims]
+        for label in ('cold', 'cached'):
+            before = stats().get('wikipedia', 0)
+            start = time.perf_counter()
+            found = sum(bool(clean_app.search_wikipedia(text)) for text in texts)
+            elapsed = time.perf_counter() - start
+            print(f"wikipedia {label:<8} {len(texts)} texts  {elapsed * 1000:7.0f} ms  "
+                  f"{found} with context  {stats().get('wikipedia', 0) - before} requests")
+
+        # Groq: one call per claim vs. packed batches (429s retried by groq_post)
+        claims = [f"Claim {i}: {text}" for i, text in enumerate(texts)]
+        before = stats()
+        start = time.perf_counter()
+        singles = [clean_app.search_gemini(claim) for claim in claims]
+        single_time = time.perf_counter() - start
+        after = stats()
+        start = time.perf_counter()
+        batched = clean_app.search_gemini_batch([claim + ' (batched)' for claim in claims])
+        batch_time = time.perf_counter() - start
+        final = stats()
+
+        for label, results, elapsed, a, b in (('single', singles, single_time, before, after),
+                                              ('batched', batched, batch_time, after, final)):
+            answered = sum(result['verdict'] in ('REAL', 'FAKE') for result in results)
+            print(f"groq {label:<13} {len(claims)} claims {elapsed * 1000:7.0f} ms  {answered} answered  "
+                  f"{b.get('groq', 0) - a.get('groq', 0)} requests  "
+                  f"{b.get('groq_429', 0) - a.get('groq_429', 0)} x 429  "
+                  f"{b.get('groq_503', 0) - a.get('groq_503', 0)} x 503")
+
+        print(f"\nbreaker: {clean_app.groq_breaker.state}  server counters: {json.dumps(stats(), sort_keys=True)}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: predict_news_batch vs. scoring articles one at a time.
+Usage: python benchmarks/bench_predict_batch.py [--articles 2000] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+# Run from project directory (models/ and the learning database are relative)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(BASE_DIR)
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault("FAKE_NEWS_FAST_START", "1")
+
+# Keep the startup banner out of the benchmark output
+with contextlib.redirect_stdout(io.StringIO()):
+    import clean_app
+
+
+def best_time(fn, repeat):
+    """Return the fastest wall time of `repeat` runs"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--articles', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if clean_app.get_models() is None:
+        print("No trained model found, training one first...")
+        clean_app.train_model()
+
+    data = clean_app.generate_bootstrap_training_data()
+    texts = [data[i % len(data)]['text'] for i in range(args.articles)]
+
+    per_item = best_time(lambda: [clean_app.predict_news_batch([t]) for t in texts], args.repeat)
+    batched = best_time(lambda: clean_app.predict_news_batch(texts), args.repeat)
+
+    print(f"Articles:   {len(texts)}")
+    print(f"Per-item:   {len(texts) / per_item:10.1f} articles/sec ({per_item:.3f}s)")
+    print(f"Batch:      {len(texts) / batched:10.1f} articles/sec ({batched:.3f}s)")
+    print(f"Speedup:    {per_item / batched:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
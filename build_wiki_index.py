@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📚 Offline Wikipedia Index Builder
+Turns a downloaded dump into wiki_index.sqlite3 (title -> intro extract, SQLite FTS5)
+so search_wikipedia works without network access.
+
+Usage:
+    python build_wiki_index.py enwiki-latest-abstract.xml.gz
+    python build_wiki_index.py intros.jsonl -o wiki_index.sqlite3
+    python build_wiki_index.py --search "central bank"
+
+Input formats:
+    - Wikipedia abstract dump (XML, optionally .gz):
+      https://dumps.wikimedia.org/enwiki/latest/enwiki-latest-abstract.xml.gz
+    - JSON lines with "title" and "extract" (or "abstract" / "text")
+
+Then run the app with FAKE_NEWS_WIKI_BACKEND=offline (air-gapped) or auto
+(the default: index first, online API only for titles it does not have).
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sqlite3
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+EXTRACT_MAX_CHARS = 1000  # search_wikipedia only shows the first 200
+BATCH_SIZE = 5000
+
+
+def title_key(title):
+    """Lookup key (must match clean_app.offline_wikipedia_intros)"""
+    return title.strip().lower()
+
+
+def open_dump(path):
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+
+def iter_abstract_dump(path):
+    """(title, extract) from an abstract XML dump, streamed"""
+    with open_dump(path) as f:
+        title, abstract, root = None, None, None
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem  # <feed>, which holds every <doc>
+                continue
+            if elem.tag == 'title':
+                title = (elem.text or '').strip()
+                if title.startswith('Wikipedia: '):
+                    title = title[len('Wikipedia: '):]
+            elif elem.tag == 'abstract':
+                abstract = (elem.text or '').strip()
+            elif elem.tag == 'doc':
+                if title and abstract:
+                    yield title, abstract
+                title, abstract = None, None
+                root.clear()  # Drop finished docs from <feed> - keeps memory flat on multi-GB dumps
+
+
+def iter_jsonl_dump(path):
+    """(title, extract) from JSON lines"""
+    with open_dump(path) as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            title = (record.get('title') or '').strip()
+            extract = (record.get('extract') or record.get('abstract') or record.get('text') or '').strip()
+            if title and extract:
+                yield title, extract
+
+
+def create_schema(conn):
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS articles (
+            title_key TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            extract TEXT NOT NULL
+        );
+    """)
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts
+            USING fts5(title, extract, content='articles', content_rowid='rowid')
+        """)
+        return True
+    except sqlite3.OperationalError:
+        print("⚠️  SQLite was built without FTS5 - title lookups work, --search does not")
+        return False
+
+
+def build(path, output):
+    is_xml = '.xml' in os.path.basename(path)
+    records = iter_abstract_dump(path) if is_xml else iter_jsonl_dump(path)
+
+    tmp_output = output + '.tmp'
+    if os.path.exists(tmp_output):
+        os.remove(tmp_output)
+    conn = sqlite3.connect(tmp_output)
+    conn.execute('PRAGMA journal_mode=OFF')
+    conn.execute('PRAGMA synchronous=OFF')
+    has_fts = create_schema(conn)
+
+    start = time.time()
+    count = 0  # Rows actually inserted (duplicate titles are ignored)
+    skipped = 0
+    batch = []
+    for title, extract in records:
+        # Disambiguation stubs are useless as context
+        if extract.endswith('may refer to:'):
+            continue
+        batch.append((title_key(title), title, extract[:EXTRACT_MAX_CHARS]))
+        if len(batch) >= BATCH_SIZE:
+            inserted = conn.executemany('INSERT OR IGNORE INTO articles VALUES (?, ?, ?)', batch).rowcount
+            count += inserted
+            skipped += len(batch) - inserted
+            batch = []
+            print(f"\r  Indexed {count:,} articles...", end='', flush=True)
+    if batch:
+        inserted = conn.executemany('INSERT OR IGNORE INTO articles VALUES (?, ?, ?)', batch).rowcount
+        count += inserted
+        skipped += len(batch) - inserted
+
+    if has_fts:
+        print("\n  Building full-text index...")
+        conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+    conn.commit()
+    conn.close()
+    os.replace(tmp_output, output)
+
+    print(f"✅ {count:,} articles -> {output} ({os.path.getsize(output) / 1e6:.1f} MB, {time.time() - start:.1f}s)"
+          + (f", {skipped:,} duplicate titles skipped" if skipped else ""))
+
+
+def search(output, query, limit=5):
+    conn = sqlite3.connect(f'file:{output}?mode=ro', uri=True)
+    rows = conn.execute(
+        'SELECT title, substr(extract, 1, 200) FROM articles_fts WHERE articles_fts MATCH ? ORDER BY rank LIMIT ?',
+        (query, limit)
+    ).fetchall()
+    for title, extract in rows:
+        print(f"📄 {title}\n   {extract}\n")
+    if not rows:
+        print("No matches")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline Wikipedia index used by search_wikipedia")
+    parser.add_argument("dump", nargs='?', help="Abstract XML dump (.xml / .xml.gz) or JSON lines file")
+    parser.add_argument("-o", "--output", default="wiki_index.sqlite3", help="Index file (default: wiki_index.sqlite3)")
+    parser.add_argument("--search", help="Full-text search an existing index instead of building")
+    args = parser.parse_args()
+
+    if args.search:
+        search(args.output, args.search)
+        return 0
+    if not args.dump:
+        parser.error("a dump file is required (or --search)")
+    if not os.path.exists(args.dump):
+        print(f"❌ {args.dump} not found")
+        return 1
+
+    build(args.dump, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,29 +11,49 @@ import os
 import time
 import threading
 import json
+import hashlib
+import sqlite3
 from datetime import datetime
 import difflib
+import zlib
+import math
+import re
+import html
+import random
+import functools
+import multiprocessing
+import copy
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, TimeoutError as FuturesTimeout
+from urllib.parse import urlparse
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
 
+# Spawned worker processes (training pool) import this module again - stay quiet there
+_WORKER_PROCESS = multiprocessing.current_process().name != 'MainProcess'
+
 # Terminal Loading Bar Function
 def print_loading_bar(percentage, bar_length=50):
     """Print loading bar in terminal"""
+    if _WORKER_PROCESS:
+        return
     filled = int(bar_length * percentage / 100)
     bar = '█' * filled + '░' * (bar_length - filled)
     sys.stdout.write(f'\r🚀 Loading: |{bar}| {percentage}%')
     sys.stdout.flush()
 
 # Print startup banner
-print("\n" + "="*60)
-print("🛡️  FAKE NEWS DETECTOR - AI POWERED")
-print("="*60)
-print("Starting up...")
-print()
+if not _WORKER_PROCESS:
+    print("\n" + "="*60)
+    print("🛡️  FAKE NEWS DETECTOR - AI POWERED")
+    print("="*60)
+    print("Starting up...")
+    print()
 
-# Fast start flag (skip package checks/installs if set)
-FAST_START = os.getenv('FAKE_NEWS_FAST_START') == '1'
+# Fast start flag (skip package checks/installs if set; worker processes never repeat them)
+FAST_START = os.getenv('FAKE_NEWS_FAST_START') == '1' or _WORKER_PROCESS
 
 # Auto-install packages with progress
 def install_package(package, idx, total):
@@ -62,13 +82,13 @@ if not FAST_START:
 
 print_loading_bar(0, 50)
 packages = ["customtkinter", "pillow", "nltk", "numpy", "pandas", "joblib", "faker", 
-            "beautifulsoup4", "requests", "scikit-learn", "feedparser"]
+            "beautifulsoup4", "requests", "scikit-learn", "scipy", "feedparser"]
 
 if not FAST_START:
     for idx, pkg in enumerate(packages):
         install_package(pkg, idx, len(packages))
     print()  # New line after progress bar
-else:
+elif not _WORKER_PROCESS:
     print("Fast start: skipping package checks (set FAKE_NEWS_FAST_START=0 to disable)")
     print_loading_bar(70, 50)
     print()
@@ -79,6 +99,7 @@ import customtkinter as ctk
 print_loading_bar(75, 50)
 import numpy as np
 import pandas as pd
+from scipy import sparse
 print_loading_bar(78, 50)
 import joblib
 import nltk
@@ -87,9 +108,9 @@ from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
 from nltk.stem import WordNetLemmatizer
 print_loading_bar(84, 50)
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
 print_loading_bar(87, 50)
 import requests
@@ -129,72 +150,168 @@ except:
 
 print_loading_bar(96, 50)
 
+# ======================== TEXT SIGNALS ========================
+# Every keyword heuristic reads from one text_signals() pass instead of re-scanning the text
+SIGNAL_GROUPS = {
+    'sensational': ('shocking', 'exposed', 'urgent', 'breaking', 'exclusive', 'unbelievable', 'incredible'),
+    'emotional': ('hate', 'love', 'terrible', 'amazing', 'disgusting', 'perfect', 'worst'),
+    'credible': ('according to', 'research shows', 'study found', 'expert says', 'data shows', 'evidence', 'verified'),
+    'attribution': ('according to', 'said', 'reported', 'announced', 'stated'),
+    'explain_attribution': ('said', 'according', 'reported'),
+    'explain_sources': ('research', 'study', 'data', 'evidence'),
+    'factcheck_fake': ('hoax', 'fake', 'false', 'debunked', 'misleading'),
+    'factcheck_real': ('verified', 'confirmed', 'authentic', 'true', 'accurate'),
+    'markers': ('!!!', '100%'),
+}
+CASE_SENSITIVE_SIGNALS = ('URGENT', 'EXPOSED', 'http', 'www.')  # Matched exactly as written
+
+def _trie_regex(terms):
+    """Alternation factored by shared prefixes (one branch per next character, longest match first)"""
+    trie = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[''] = {}  # A term ends here
+    
+    def render(node):
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = '(?:' + '|'.join(branches) + ')' if len(branches) > 1 or '' in node else branches[0]
+        return body + '?' if '' in node else body  # Greedy: the longer term wins
+    
+    return render(trie)
+
+def _build_signal_matcher():
+    """
+    One prefix-factored alternation over the lowercased text, longest term first at each
+    position. The longest term found at a position implies every term it contains.
+    """
+    terms = {term for group in SIGNAL_GROUPS.values() for term in group}
+    terms.update(term.lower() for term in CASE_SENSITIVE_SIGNALS)
+    pattern = re.compile(_trie_regex(terms))
+    contains = {term: tuple(other for other in sorted(terms) if other in term) for term in terms}
+    exact = {}
+    for term in CASE_SENSITIVE_SIGNALS:
+        exact.setdefault(term.lower(), []).append(term)
+    return pattern, contains, exact
+
+_SIGNAL_RE, _SIGNAL_CONTAINS, _SIGNAL_EXACT = _build_signal_matcher()
+_NUMBER_RE = re.compile(r'\d+')
+
+def text_signals(text):
+    """
+    Keyword hits and character counts for all heuristics, from one matcher pass
+    - 'terms': lowercase terms present anywhere (substring, case-insensitive)
+    - 'exact': CASE_SENSITIVE_SIGNALS present as written
+    """
+    text_lower = text.lower()
+    aligned = len(text_lower) == len(text)  # A few characters lowercase to two
+    terms = set()
+    exact = set()
+    # search() from each match start + 1 finds overlapping terms; much faster than IGNORECASE
+    match = _SIGNAL_RE.search(text_lower)
+    while match:
+        start = match.start()
+        for term in _SIGNAL_CONTAINS[match.group()]:
+            terms.add(term)
+            if aligned:
+                for spelling in _SIGNAL_EXACT.get(term, ()):
+                    if spelling in text[start:match.end()]:
+                        exact.add(spelling)
+        match = _SIGNAL_RE.search(text_lower, start + 1)
+    if not aligned:
+        exact = {spelling for spelling in CASE_SENSITIVE_SIGNALS if spelling in text}
+    return {
+        'terms': terms,
+        'exact': exact,
+        'length': len(text),
+        'upper': sum(map(str.isupper, text)),
+        'exclamations': text.count('!'),
+        'questions': text.count('?'),
+        'periods': text.count('.'),
+        'numbers': len(_NUMBER_RE.findall(text)),
+        'words': len(text.split())
+    }
+
+def signal_count(signals, group):
+    """How many of a group's terms occur in the text"""
+    return sum(1 for term in SIGNAL_GROUPS[group] if term in signals['terms'])
+
+def signal_indicators(signals):
+    """Short indicator labels shown next to the verdict"""
+    indicators = []
+    if '!!!' in signals['terms']:
+        indicators.append("Multiple !!!")
+    if 'urgent' in signals['terms']:
+        indicators.append("Urgency")
+    return indicators
+
 # ======================== LOCAL FACT-CHECK (No API) ========================
-def local_fact_check(text):
+def local_fact_check(text, signals=None):
     """Local fact-checking without API - pattern based"""
     analysis = []
     score = 0.5  # Neutral starting score
-    text_lower = text.lower()
+    if signals is None:
+        signals = text_signals(text)
+    length = max(signals['length'], 1)
     
     # Check 1: Sensationalism indicators
-    sensational_words = ['shocking', 'exposed', 'urgent', 'breaking', 'exclusive', 'unbelievable', 'incredible']
-    sensational_count = sum(1 for word in sensational_words if word in text_lower)
+    sensational_count = signal_count(signals, 'sensational')
     if sensational_count > 2:
         analysis.append("🚩 High sensationalism detected")
         score -= 0.2
     
     # Check 2: Emotional language
-    emotional_words = ['hate', 'love', 'terrible', 'amazing', 'disgusting', 'perfect', 'worst']
-    emotional_count = sum(1 for word in emotional_words if word in text_lower)
+    emotional_count = signal_count(signals, 'emotional')
     if emotional_count > 3:
         analysis.append("🚩 Excessive emotional language")
         score -= 0.15
     
     # Check 3: All caps abuse
-    caps_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
+    caps_ratio = signals['upper'] / length
     if caps_ratio > 0.15:
         analysis.append(f"🚩 Excessive capitalization ({caps_ratio*100:.1f}%)")
         score -= 0.1
     
     # Check 4: Exclamation marks
-    exclamation_ratio = text.count('!') / max(len(text), 1)
+    exclamation_ratio = signals['exclamations'] / length
     if exclamation_ratio > 0.05:
-        analysis.append(f"🚩 Too many exclamations ({text.count('!')} found)")
+        analysis.append(f"🚩 Too many exclamations ({signals['exclamations']} found)")
         score -= 0.1
     
     # Check 5: Question marks (clickbait)
-    question_ratio = text.count('?') / max(len(text), 1)
+    question_ratio = signals['questions'] / length
     if question_ratio > 0.03:
         analysis.append(f"🚩 Clickbait question pattern")
         score -= 0.05
     
     # Check 6: Credibility indicators (positive)
-    credible_words = ['according to', 'research shows', 'study found', 'expert says', 'data shows', 'evidence', 'verified']
-    credible_count = sum(1 for word in credible_words if word in text_lower)
+    credible_count = signal_count(signals, 'credible')
     if credible_count > 0:
         analysis.append(f"✓ {credible_count} credibility indicators found")
         score += credible_count * 0.1
     
     # Check 7: Source attribution
-    if any(phrase in text_lower for phrase in ['according to', 'said', 'reported', 'announced', 'stated']):
+    if signal_count(signals, 'attribution'):
         analysis.append("✓ Proper source attribution")
         score += 0.1
     
     # Check 8: URL/links
-    has_links = 'http' in text or 'www.' in text
+    has_links = 'http' in signals['exact'] or 'www.' in signals['exact']
     if has_links:
         analysis.append("✓ Contains references/links")
         score += 0.05
     
     # Check 9: Numbers and data
-    import re
-    numbers = len(re.findall(r'\d+', text))
+    numbers = signals['numbers']
     if numbers > 3:
         analysis.append(f"✓ Contains {numbers} numerical data points")
         score += 0.1
     
     # Check 10: Length quality
-    word_count = len(text.split())
+    word_count = signals['words']
     if word_count < 50:
         analysis.append("🚩 Very short text (potential clickbait)")
         score -= 0.1
@@ -211,187 +328,1087 @@ def local_fact_check(text):
         "status": "✓ Local"
     }
 
+# ======================== HTTP CLIENT ========================
+# One keep-alive session for Groq, Wikipedia and feeds (TLS handshakes are reused)
+HTTP_POOL_CONNECTIONS = int(os.getenv('FAKE_NEWS_HTTP_POOL_CONNECTIONS', '16'))  # Hosts kept open
+HTTP_POOL_MAXSIZE = int(os.getenv('FAKE_NEWS_HTTP_POOL_MAXSIZE', '8'))  # Connections per host
+GROQ_TIMEOUT = float(os.getenv('FAKE_NEWS_GROQ_TIMEOUT', '15'))
+WIKI_TIMEOUT = float(os.getenv('FAKE_NEWS_WIKI_TIMEOUT', '2'))
+USER_AGENT = 'FakeNewsDetector/1.0'
+
+_http_session = None
+_http_session_lock = threading.Lock()
+_groq_api_key = None
+
+def get_http_session():
+    """Shared requests session with a connection pool per host"""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS,
+                                                        pool_maxsize=HTTP_POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers['User-Agent'] = USER_AGENT
+                _http_session = session
+    return _http_session
+
+# Groq guard: client-side rate limit, retries on 429/5xx, circuit breaker
+GROQ_REQUESTS_PER_MINUTE = float(os.getenv('FAKE_NEWS_GROQ_RPM', '30'))  # Plan limit
+GROQ_BURST = int(os.getenv('FAKE_NEWS_GROQ_BURST', '5'))
+GROQ_MAX_RETRIES = int(os.getenv('FAKE_NEWS_GROQ_MAX_RETRIES', '3'))
+GROQ_BACKOFF_BASE = 1.0  # Seconds, doubled per attempt (full jitter)
+GROQ_BACKOFF_MAX = 20.0  # Longer Retry-After values are not waited out
+GROQ_RETRY_DEADLINE = float(os.getenv('FAKE_NEWS_GROQ_RETRY_DEADLINE', '30'))  # Seconds for all attempts together
+GROQ_BREAKER_FAILURES = int(os.getenv('FAKE_NEWS_GROQ_BREAKER_FAILURES', '5'))  # Consecutive failures to open
+GROQ_BREAKER_COOLDOWN = float(os.getenv('FAKE_NEWS_GROQ_BREAKER_COOLDOWN', '60'))  # Seconds before a trial call
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Token bucket rate limiter: `rate` tokens per second, bursts up to `capacity`"""
+    
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, timeout=None):
+        """Take one token, waiting up to `timeout` seconds - returns False if none came in time"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                wait = (1 - self.tokens) / self.rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            time.sleep(wait)
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures, lets one trial call through every `cooldown` seconds"""
+    
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.lock = threading.Lock()
+    
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        return 'half-open' if self.trial_running else 'open'
+    
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if not self.trial_running and time.monotonic() - self.opened_at >= self.cooldown:
+                self.trial_running = True
+                return True
+            return False
+    
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+    
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial_running = False
+            if self.failures >= self.threshold or self.opened_at is not None:
+                self.opened_at = time.monotonic()
+    
+    def release(self):
+        """No request was sent (local reasons) - end a granted trial without counting anything"""
+        with self.lock:
+            self.trial_running = False
+
+class GroqThrottled(Exception):
+    """No client-side rate-limit slot before the deadline - the API was never called"""
+
+groq_rate_limiter = TokenBucket(GROQ_REQUESTS_PER_MINUTE / 60.0, GROQ_BURST)
+groq_breaker = CircuitBreaker(GROQ_BREAKER_FAILURES, GROQ_BREAKER_COOLDOWN)
+
+def _retry_delay(response, attempt):
+    """Seconds to wait before retrying: Retry-After when given, else jittered exponential backoff"""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(retry_after)  # HTTP-date form
+                delay = (when - datetime.now(when.tzinfo)).total_seconds()
+            except:
+                delay = None
+        if delay is not None:
+            return max(0.0, delay)
+    return random.uniform(0, min(GROQ_BACKOFF_MAX, GROQ_BACKOFF_BASE * 2 ** attempt))
+
+def groq_post(url, headers, payload):
+    """
+    POST to Groq through the rate limiter. 429/5xx and connection errors are retried
+    (Retry-After honored) within GROQ_RETRY_DEADLINE; a read timeout is not retried.
+    Returns the last response or raises the last connection error - or GroqThrottled
+    when the local rate limiter had no slot for even the first attempt.
+    """
+    deadline = time.monotonic() + GROQ_RETRY_DEADLINE
+    response, error = None, None
+    for attempt in range(GROQ_MAX_RETRIES + 1):
+        remaining = deadline - time.monotonic()
+        if not groq_rate_limiter.acquire(timeout=min(GROQ_TIMEOUT, remaining)):
+            if attempt == 0:
+                raise GroqThrottled("Groq rate limit: no request slot available")
+            break  # Report the last real outcome
+        try:
+            timeout = min(GROQ_TIMEOUT, max(1.0, deadline - time.monotonic()))
+            response, error = get_http_session().post(url, headers=headers, json=payload, timeout=timeout), None
+        except requests.ReadTimeout as e:
+            response, error = None, e
+            break  # The request may still be running server-side - don't pay the timeout again
+        except requests.RequestException as e:
+            response, error = None, e
+        
+        if response is not None and response.status_code not in RETRY_STATUSES:
+            return response
+        if attempt == GROQ_MAX_RETRIES:
+            break
+        delay = _retry_delay(response, attempt)
+        if delay > GROQ_BACKOFF_MAX or delay >= deadline - time.monotonic():
+            break  # Longer pause than we are willing to block
+        time.sleep(delay)
+    
+    if error is not None:
+        raise error
+    return response
+
+def get_groq_api_key():
+    """Groq API key from config.json (read once)"""
+    global _groq_api_key
+    if _groq_api_key is None:
+        with open("config.json", 'r', encoding='utf-8') as f:
+            _groq_api_key = json.load(f)["groq_api_key"]
+    return _groq_api_key
+
 # ======================== WIKIPEDIA API ========================
-# WIKI CACHE FOR SPEED
-_wiki_cache = {}
+WIKI_API_URL = os.getenv('FAKE_NEWS_WIKI_URL', "https://en.wikipedia.org/w/api.php")
+WIKI_CACHE_TTL = float(os.getenv('FAKE_NEWS_WIKI_CACHE_TTL_HOURS', '168')) * 3600  # Found articles
+WIKI_NEGATIVE_TTL = float(os.getenv('FAKE_NEWS_WIKI_NEGATIVE_TTL_HOURS', '24')) * 3600  # Keywords without one
+WIKI_BACKEND = os.getenv('FAKE_NEWS_WIKI_BACKEND', 'auto')  # online | offline | auto (index first, then online)
+WIKI_INDEX_PATH = os.getenv('FAKE_NEWS_WIKI_INDEX', 'wiki_index.sqlite3')  # Built by build_wiki_index.py
+
+def wikipedia_keywords(text):
+    """Lookup keywords: first meaningful words of the text"""
+    keywords = []
+    common_words = {'this', 'that', 'have', 'with', 'from', 'about', 'only', 'when', 'been', 'the', 'is', 'are'}
+    
+    for word in text.split()[:5]:  # Reduced from 8 for speed
+        clean_word = word.strip('.,!?;:-').lower()
+        if len(clean_word) > 3 and clean_word not in common_words and clean_word not in keywords:
+            keywords.append(clean_word)
+    
+    return keywords[:2]  # Reduced from 3 for speed
+
+def fetch_wikipedia_intros(keywords):
+    """One API request for several titles - {keyword: intro[:200] or None} (raises on network errors)"""
+    resp = get_http_session().get(
+        WIKI_API_URL,
+        params={
+            "action": "query",
+            "format": "json",
+            "titles": "|".join(keywords),
+            "prop": "extracts",
+            "explaintext": True,
+            "exintro": True,
+            "exlimit": "max",
+            "redirects": True
+        },
+        timeout=WIKI_TIMEOUT
+    )
+    resp.raise_for_status()
+    query = resp.json().get('query', {})
+    
+    # Map each keyword through title normalization and redirects to its page
+    normalized = {n['from']: n['to'] for n in query.get('normalized', [])}
+    redirects = {r['from']: r['to'] for r in query.get('redirects', [])}
+    extracts = {
+        page.get('title'): (page.get('extract') or '').strip()
+        for page in query.get('pages', {}).values()
+        if 'missing' not in page and 'invalid' not in page
+    }
+    
+    results = {}
+    for keyword in keywords:
+        title = normalized.get(keyword, keyword)
+        extract = extracts.get(redirects.get(title, title), '')
+        results[keyword] = extract[:200] if len(extract) > 20 else None  # Reduced from 250
+    return results
+
+def offline_wikipedia_intros(keywords):
+    """{keyword: intro[:200]} from the local index (keywords it has no article for are left out)"""
+    if not os.path.exists(WIKI_INDEX_PATH):
+        return {}
+    conns = _db_local.__dict__.setdefault('conns', {})
+    conn = conns.get(('wiki-index', WIKI_INDEX_PATH))
+    if conn is None:
+        conn = sqlite3.connect(f'file:{WIKI_INDEX_PATH}?mode=ro', uri=True)
+        conns[('wiki-index', WIKI_INDEX_PATH)] = conn
+    
+    found = {}
+    rows = conn.execute(
+        f'SELECT title_key, extract FROM articles WHERE title_key IN ({",".join("?" * len(keywords))})',
+        [keyword.strip().lower() for keyword in keywords]
+    )
+    extracts = dict(rows.fetchall())
+    for keyword in keywords:
+        extract = extracts.get(keyword.strip().lower(), '')
+        if len(extract) > 20:
+            found[keyword] = extract[:200]
+    return found
+
+def wiki_cache_get(keywords):
+    """Fresh cached lookups {keyword: extract or None (known miss)}"""
+    now = time.time()
+    found = {}
+    try:
+        rows = get_cache_db().execute(
+            f'SELECT keyword, extract, fetched_at FROM wiki_cache WHERE keyword IN ({",".join("?" * len(keywords))})',
+            keywords
+        )
+        for row in rows:
+            ttl = WIKI_CACHE_TTL if row['extract'] is not None else WIKI_NEGATIVE_TTL
+            if now - row['fetched_at'] <= ttl:
+                found[row['keyword']] = row['extract']
+    except:
+        pass
+    return found
+
+def wiki_cache_put(results):
+    """Store lookups, misses included (negative entries)"""
+    now = time.time()
+    try:
+        conn = get_cache_db()
+        with conn:
+            conn.executemany(
+                'INSERT OR REPLACE INTO wiki_cache (keyword, extract, fetched_at) VALUES (?, ?, ?)',
+                [(keyword, extract, now) for keyword, extract in results.items()]
+            )
+    except:
+        pass
 
 def search_wikipedia(text):
-    """Search Wikipedia for context (with fast caching)"""
+    """Search Wikipedia for context (offline index and/or API with a per-keyword disk cache)"""
     try:
-        text_hash = hash(text[:50])
-        if text_hash in _wiki_cache:
-            return _wiki_cache[text_hash]
-        
-        words = text.split()
-        keywords = []
-        common_words = {'this', 'that', 'have', 'with', 'from', 'about', 'only', 'when', 'been', 'the', 'is', 'are'}
+        keywords = wikipedia_keywords(text)
+        if not keywords:
+            return {}
         
-        for word in words[:5]:  # Reduced from 8 for speed
-            clean_word = word.strip('.,!?;:-').lower()
-            if len(clean_word) > 3 and clean_word not in common_words:
-                keywords.append(clean_word)
-        
-        wiki_results = {}
-        
-        for keyword in keywords[:2]:  # Reduced from 3 for speed
+        found = {}
+        if WIKI_BACKEND in ('offline', 'auto'):
             try:
-                resp = requests.get(
-                    "https://en.wikipedia.org/w/api.php",
-                    params={
-                        "action": "query",
-                        "format": "json",
-                        "titles": keyword,
-                        "prop": "extracts",
-                        "explaintext": True,
-                        "exintro": True,
-                        "redirects": True
-                    },
-                    timeout=2,  # Reduced from 4 seconds
-                    headers={'User-Agent': 'FakeNewsDetector/1.0'}
-                )
-                
-                if resp.status_code == 200:
-                    pages = resp.json().get('query', {}).get('pages', {})
-                    for page_id, page in pages.items():
-                        if page_id != '-1' and 'extract' in page and page['extract']:
-                            extract = page['extract'].strip()
-                            if extract and len(extract) > 20:
-                                wiki_results[keyword] = extract[:200]  # Reduced from 250
-                                break
+                found = offline_wikipedia_intros(keywords)
             except:
                 pass
+            if WIKI_BACKEND == 'offline':
+                return found
         
-        _wiki_cache[text_hash] = wiki_results
-        return wiki_results
+        remaining = [keyword for keyword in keywords if keyword not in found]
+        found.update(wiki_cache_get(remaining) if remaining else {})
+        misses = [keyword for keyword in remaining if keyword not in found]
+        if misses:
+            try:
+                fetched = fetch_wikipedia_intros(misses)
+                wiki_cache_put(fetched)
+                found.update(fetched)
+            except:
+                pass  # Network trouble is not a miss - nothing cached
+        
+        return {keyword: found[keyword] for keyword in keywords if found.get(keyword)}
     except:
         return {}
 
+# ======================== NEAR-DUPLICATE INDEX ========================
+# MinHash signatures over character shingles, bucketed with LSH banding:
+# only items sharing a bucket are compared with difflib.
+NEAR_DUP_THRESHOLD = float(os.getenv('FAKE_NEWS_NEAR_DUP_THRESHOLD', '0.75'))
+NEAR_DUP_RECALL = 0.99  # Chance that the least similar pair above the threshold still shares a bucket
+SHINGLE_SIZE = 4
+LSH_ROWS = 2  # Few rows per band: the S-curve knee sits far below the threshold
+
+def jaccard_floor(threshold, shingle_size=SHINGLE_SIZE):
+    """
+    Lowest shingle Jaccard expected for a pair just above the difflib threshold.
+    Worst case is edits spread evenly: a shingle survives when all its characters
+    match (threshold ** shingle_size).
+    """
+    shared = threshold ** shingle_size
+    return shared / (2 - shared)
+
+def lsh_band_count(threshold, rows=LSH_ROWS, recall=NEAR_DUP_RECALL):
+    """Bands needed so that pairs at the Jaccard floor become candidates with `recall` probability"""
+    return math.ceil(math.log(1 - recall) / math.log(1 - jaccard_floor(threshold) ** rows))
+
+LSH_BANDS = lsh_band_count(NEAR_DUP_THRESHOLD)  # 129 for 0.75 (Jaccard floor ~0.19)
+LSH_PARAMS = f"minhash:{SHINGLE_SIZE}:{LSH_BANDS}x{LSH_ROWS}:seed1"  # Stored index is rebuilt when this changes
+
+_MINHASH_PRIME = 4294967311  # 2^32 + 15
+_minhash_rng = np.random.RandomState(1)  # Fixed seed - signatures are persisted
+_MINHASH_A = _minhash_rng.randint(1, 1 << 29, size=LSH_BANDS * LSH_ROWS).astype(np.int64)
+_MINHASH_B = _minhash_rng.randint(0, 1 << 29, size=LSH_BANDS * LSH_ROWS).astype(np.int64)
+
+def text_shingles(text):
+    """Character shingles of the lowercased, whitespace-collapsed text"""
+    norm = ' '.join(text.lower().split())
+    return {norm[i:i + SHINGLE_SIZE] for i in range(max(1, len(norm) - SHINGLE_SIZE + 1))}
+
+def minhash_signature(text, shingles=None):
+    """MinHash signature of the text's shingles"""
+    shingles = text_shingles(text) if shingles is None else shingles
+    hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles), dtype=np.int64, count=len(shingles))
+    return ((np.outer(hashes, _MINHASH_A) + _MINHASH_B) % _MINHASH_PRIME).min(axis=0)
+
+def lsh_keys(signature):
+    """One bucket key per band (the band number is part of the key)"""
+    return [
+        int.from_bytes(hashlib.blake2b(band.to_bytes(2, 'big') + rows.tobytes(), digest_size=8).digest(), 'big', signed=True)
+        for band, rows in enumerate(signature.reshape(LSH_BANDS, LSH_ROWS))
+    ]
+
+def index_sample(conn, sample_id, text):
+    """Add one stored item to the LSH buckets"""
+    conn.executemany(
+        'INSERT OR IGNORE INTO lsh_buckets (bucket, sample_id) VALUES (?, ?)',
+        [(key, sample_id) for key in lsh_keys(minhash_signature(text))]
+    )
+
+def rebuild_near_dup_index(conn):
+    """(Re)build the LSH buckets when missing or built with other parameters"""
+    row = conn.execute("SELECT value FROM meta WHERE key = 'lsh_params'").fetchone()
+    if row and row['value'] == LSH_PARAMS:
+        return
+    with conn:
+        conn.execute('DELETE FROM lsh_buckets')
+        for sample in conn.execute('SELECT id, text FROM samples').fetchall():
+            index_sample(conn, sample['id'], sample['text'])
+        conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('lsh_params', ?)", (LSH_PARAMS,))
+
+def find_near_duplicate(conn, text, threshold=None):
+    """Id of a stored item more than `threshold` similar to text (difflib ratio), else None"""
+    threshold = NEAR_DUP_THRESHOLD if threshold is None else threshold
+    min_jaccard = jaccard_floor(threshold) / 2
+    shingles = text_shingles(text)
+    keys = lsh_keys(minhash_signature(text, shingles))
+    text_lower = text.lower().strip()
+    rows = conn.execute(
+        'SELECT DISTINCT s.id, s.text FROM lsh_buckets b JOIN samples s ON s.id = b.sample_id '
+        f'WHERE b.bucket IN ({",".join("?" * len(keys))})',
+        keys
+    )
+    for row in rows:
+        # Exact shingle overlap first - far cheaper than difflib; unrelated items sit near 0.02
+        other = text_shingles(row['text'])
+        if len(shingles & other) < min_jaccard * len(shingles | other):
+            continue
+        matcher = difflib.SequenceMatcher(None, row['text'].lower().strip(), text_lower)
+        if matcher.real_quick_ratio() > threshold and matcher.quick_ratio() > threshold and matcher.ratio() > threshold:
+            return row['id']
+    return None
+
 # ======================== DATABASE ========================
-def load_learning_database():
-    """Load learning database - returns list of items"""
-    if os.path.exists('learning_db.json'):
-        try:
-            with open('learning_db.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # If it's already a list, return it
-            if isinstance(data, list):
-                return data
-            # If it's old format (dict with real/fake), convert to list
-            elif isinstance(data, dict):
-                result = []
-                for item in data.get('real', []):
-                    if isinstance(item, dict):
-                        result.append(item)
-                for item in data.get('fake', []):
-                    if isinstance(item, dict):
-                        result.append(item)
-                return result
-            else:
-                return []
-        except:
-            return []
-    return []
+LEARNING_DB_PATH = 'learning_db.sqlite3'
+LEARNING_DB_MAX_ITEMS = int(os.getenv('FAKE_NEWS_LEARNING_DB_MAX_ITEMS', '2000'))  # Keep only the newest items
+FUZZY_DEDUP_SOURCES = ["BBC Live", "BBC", "Reuters"]
+FEED_SEEN_GUIDS_MAX = 500  # Newest GUIDs remembered per feed
+
+_db_local = threading.local()
+_db_init_lock = threading.Lock()
+_db_initialized = set()
+
+def connect_db(path):
+    """Per-thread SQLite connection (WAL: readers never block the writer)"""
+    conns = _db_local.__dict__.setdefault('conns', {})
+    conn = conns.get(path)
+    if conn is None:
+        conn = sqlite3.connect(path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA foreign_keys=ON')
+        conns[path] = conn
+    return conn
+
+def get_learning_db():
+    """Connection to the learning database (schema + JSON migration on first use)"""
+    conn = connect_db(LEARNING_DB_PATH)
+    if LEARNING_DB_PATH not in _db_initialized:
+        with _db_init_lock:
+            if LEARNING_DB_PATH not in _db_initialized:
+                init_learning_db(conn)
+                _db_initialized.add(LEARNING_DB_PATH)
+    return conn
 
-def save_learning_database(db):
-    """Save learning database"""
+def init_learning_db(conn):
+    """Create tables and indexes, then migrate learning_db.json once"""
+    with conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS samples (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text TEXT NOT NULL,
+                text_key TEXT NOT NULL UNIQUE,
+                source TEXT,
+                confidence REAL,
+                timestamp TEXT,
+                label INTEGER,
+                ai_analysis TEXT
+            );
+            CREATE INDEX IF NOT EXISTS samples_label ON samples(label);
+
+            CREATE TABLE IF NOT EXISTS analysis_index (
+                key TEXT PRIMARY KEY,
+                sample_id INTEGER REFERENCES samples(id) ON DELETE CASCADE,
+                analysis TEXT,
+                label INTEGER,
+                confidence REAL
+            );
+            CREATE INDEX IF NOT EXISTS analysis_index_sample ON analysis_index(sample_id);
+
+            CREATE TABLE IF NOT EXISTS lsh_buckets (
+                bucket INTEGER NOT NULL,
+                sample_id INTEGER NOT NULL REFERENCES samples(id) ON DELETE CASCADE,
+                PRIMARY KEY (bucket, sample_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS lsh_buckets_sample ON lsh_buckets(sample_id);
+
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS feed_cursors (
+                url TEXT PRIMARY KEY,
+                last_published TEXT,
+                seen_guids TEXT NOT NULL,
+                updated_at TEXT
+            );
+        """)
+    rebuild_near_dup_index(conn)
+    migrate_json_learning_db(conn)
+    migrate_json_analysis_index(conn)
+
+def migrate_json_learning_db(conn):
+    """One-time import of learning_db.json (list or legacy {real, fake} format)"""
+    if not os.path.exists('learning_db.json'):
+        return
+    if conn.execute('SELECT 1 FROM samples LIMIT 1').fetchone():
+        return
+    
     try:
-        with open('learning_db.json', 'w') as f:
-            json.dump(db, f, indent=2)
+        with open('learning_db.json', 'r', encoding='utf-8') as f:
+            data = json.load(f)
     except:
-        pass
+        return
+    
+    items = []
+    if isinstance(data, list):
+        items = data
+    elif isinstance(data, dict):
+        for item in data.get('real', []):
+            if isinstance(item, dict):
+                items.append(dict(item, label=item.get('label', 1)))
+        for item in data.get('fake', []):
+            if isinstance(item, dict):
+                items.append(dict(item, label=item.get('label', 0)))
+    
+    with conn:
+        for item in items:
+            if isinstance(item, str):
+                item = {'text': item, 'label': 1, 'source': 'Converted', 'confidence': 0.5}
+            if not isinstance(item, dict) or not item.get('text'):
+                continue
+            sample_id = _insert_sample(conn, item['text'], item.get('source'), item.get('confidence', 0.5),
+                                       item.get('timestamp'), item.get('label'), item.get('ai_analysis'))
+            if sample_id and item.get('ai_analysis'):
+                conn.execute(
+                    'INSERT OR REPLACE INTO analysis_index (key, sample_id, analysis, label, confidence) VALUES (?, ?, ?, ?, ?)',
+                    (analysis_key(preprocess_text(item['text'])), sample_id, item['ai_analysis'],
+                     item.get('label'), float(item.get('confidence', 0.85)))
+                )
+    
+    # Keep the old file as a backup (never migrated twice)
+    os.replace('learning_db.json', 'learning_db.json.migrated')
 
-def add_to_learning_database(text, label, source, confidence, ai_analysis=None):
-    """Add to learning database - with smart duplicate checking and AI analysis"""
-    db = load_learning_database()
+def migrate_json_analysis_index(conn):
+    """One-time import of analysis_index.json (replay entries keyed by full text)"""
+    if not os.path.exists('analysis_index.json'):
+        return
     
-    # Ensure db is a list
-    if not isinstance(db, list):
-        db = []
+    try:
+        with open('analysis_index.json', 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except:
+        return
     
-    # Check for exact duplicates and similar entries (fuzzy matching)
-    text_lower = text.lower().strip()
-    text_hash = hash(text_lower)
+    with conn:
+        for key, entry in (index.items() if isinstance(index, dict) else []):
+            conn.execute(
+                'INSERT OR IGNORE INTO analysis_index (key, analysis, label, confidence) VALUES (?, ?, ?, ?)',
+                (key, entry.get('analysis'), entry.get('label'), float(entry.get('confidence', 0.85)))
+            )
     
-    # Always check for exact matches
-    for existing in db:
-        if isinstance(existing, dict):
-            existing_text = existing.get('text', '').lower().strip()
+    os.replace('analysis_index.json', 'analysis_index.json.migrated')
+
+def text_key(text):
+    """Exact-duplicate key (case and surrounding whitespace ignored)"""
+    return hashlib.sha256(text.lower().strip().encode('utf-8')).hexdigest()
+
+def analysis_key(text_clean):
+    """Replay index key: content hash of preprocessed text"""
+    return hashlib.sha256(text_clean.encode('utf-8')).hexdigest()
+
+def _row_to_item(row):
+    item = {
+        'id': row['id'],
+        'text': row['text'],
+        'source': row['source'],
+        'confidence': row['confidence'],
+        'timestamp': row['timestamp'],
+        'label': row['label']
+    }
+    if row['ai_analysis']:
+        item['ai_analysis'] = row['ai_analysis']
+    return item
+
+def load_learning_database():
+    """Load learning database - returns list of items (oldest first)"""
+    try:
+        rows = get_learning_db().execute('SELECT * FROM samples ORDER BY id').fetchall()
+        return [_row_to_item(row) for row in rows]
+    except:
+        return []
+
+def _insert_sample(conn, text, source, confidence, timestamp, label, ai_analysis=None, key=None):
+    """Insert one row and index it for near-duplicate lookups - returns its id (None if already stored)"""
+    cur = conn.execute(
+        'INSERT OR IGNORE INTO samples (text, text_key, source, confidence, timestamp, label, ai_analysis) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        (text, key or text_key(text), source, float(confidence), timestamp, label, ai_analysis)
+    )
+    if not cur.rowcount:
+        return None
+    index_sample(conn, cur.lastrowid, text)
+    return cur.lastrowid
+
+def _trim_learning_database(conn):
+    """Drop the oldest rows beyond LEARNING_DB_MAX_ITEMS"""
+    # Ids only grow, so a span within the limit means there is nothing to trim (skips the OFFSET scan)
+    span = conn.execute('SELECT (SELECT MAX(id) FROM samples) - (SELECT MIN(id) FROM samples)').fetchone()[0]
+    if span is None or span < LEARNING_DB_MAX_ITEMS:
+        return
+    conn.execute(
+        'DELETE FROM samples WHERE id <= (SELECT id FROM samples ORDER BY id DESC LIMIT 1 OFFSET ?)',
+        (LEARNING_DB_MAX_ITEMS,)
+    )
+
+def add_many_to_learning_database(items):
+    """
+    Add a batch of items ({'text', 'label', 'source', 'confidence', optional 'ai_analysis'})
+    in one transaction. Returns one status per item:
+    'accepted' (stored), 'duplicate' (exact copy already stored or earlier in the batch),
+    'rejected' (near-duplicate of a live-feed item, or no text)
+    """
+    # Computed outside the write transaction (NLTK is slow)
+    ai_keys = [analysis_key(preprocess_text(item['text'])) if item.get('ai_analysis') else None for item in items]
+    statuses = []
+    
+    conn = get_learning_db()
+    with conn:
+        for item, ai_key in zip(items, ai_keys):
+            text = item.get('text') or ''
+            if not text.strip():
+                statuses.append('rejected')
+                continue
             
-            # Check exact match - always reject
-            if existing_text == text_lower:
-                return db  # Already exists, don't add
+            # Exact duplicates - always reject (unique index; also covers earlier rows of this batch)
+            key = text_key(text)
+            existing = conn.execute('SELECT id FROM samples WHERE text_key = ?', (key,)).fetchone()
+            sample_id = existing['id'] if existing else None
             
+            if existing is not None:
+                status = 'duplicate'
             # For BBC live news, do fuzzy matching (similar real news is likely duplicate)
-            if source in ["BBC Live", "BBC", "Reuters"]:
-                similarity = difflib.SequenceMatcher(None, existing_text, text_lower).ratio()
-                if similarity > 0.75:  # 75% similar = likely same event reported differently
-                    return db  # Similar entry exists, don't add
-            # For bootstrap data, only check exact (allow similar template-based news)
-            # For user-added news, only check exact
-    
-    sample = {
-        'text': text[:300],
-        'source': source,
-        'confidence': float(confidence),
-        'timestamp': datetime.now().isoformat(),
-        'label': label
-    }
-    
-    # Save AI analysis if provided
-    if ai_analysis:
-        sample['ai_analysis'] = ai_analysis
-    
-    db.append(sample)
-    
-    # Keep only last 2000 items
-    if len(db) > 2000:
-        db = db[-2000:]
+            # For bootstrap data and user-added news, only check exact
+            elif item.get('source') in FUZZY_DEDUP_SOURCES and find_near_duplicate(conn, text) is not None:
+                status = 'rejected'  # Likely same event reported differently
+            else:
+                sample_id = _insert_sample(conn, text[:300], item.get('source'), item.get('confidence', 0.5),
+                                           datetime.now().isoformat(), item.get('label'), item.get('ai_analysis'), key=key)
+                status = 'accepted'
+            statuses.append(status)
+            
+            # Index the analysis under the FULL text (the stored copy is cut to 300 chars)
+            if ai_key and status != 'rejected':
+                conn.execute(
+                    'INSERT OR REPLACE INTO analysis_index (key, sample_id, analysis, label, confidence) VALUES (?, ?, ?, ?, ?)',
+                    (ai_key, sample_id, item['ai_analysis'], item.get('label'), float(item.get('confidence', 0.5)))
+                )
+        
+        if 'accepted' in statuses:
+            _trim_learning_database(conn)
     
-    save_learning_database(db)
-    return db
+    return statuses
+
+def count_accepted(items, statuses):
+    """(real, fake) counts of the items a bulk insert accepted"""
+    accepted = [item for item, status in zip(items, statuses) if status == 'accepted']
+    real = sum(1 for item in accepted if item['label'] == 1)
+    return real, len(accepted) - real
+
+def add_to_learning_database(text, label, source, confidence, ai_analysis=None):
+    """Add to learning database - with smart duplicate checking and AI analysis"""
+    statuses = add_many_to_learning_database([{
+        'text': text, 'label': label, 'source': source, 'confidence': confidence, 'ai_analysis': ai_analysis
+    }])
+    return statuses[0] == 'accepted'
+
+def add_manual_entry(text, label, source):
+    """Add a user-entered item as is (full text, full confidence) - False if it is already stored"""
+    conn = get_learning_db()
+    with conn:
+        sample_id = _insert_sample(conn, text, source, 1.0, datetime.now().isoformat(), label)
+        if sample_id is not None:
+            _trim_learning_database(conn)
+    return sample_id is not None
+
+def update_learning_label(sample_id, label):
+    """Relabel one item (REAL = 1, FAKE = 0)"""
+    conn = get_learning_db()
+    with conn:
+        conn.execute('UPDATE samples SET label = ? WHERE id = ?', (label, sample_id))
+
+def delete_learning_item(sample_id):
+    """Delete one item (its stored analysis goes with it)"""
+    conn = get_learning_db()
+    with conn:
+        conn.execute('DELETE FROM samples WHERE id = ?', (sample_id,))
+
+def get_feed_cursor(feed_url):
+    """(last_published, seen_guids) of the last successful ingest of a feed"""
+    row = get_learning_db().execute(
+        'SELECT last_published, seen_guids FROM feed_cursors WHERE url = ?', (feed_url,)
+    ).fetchone()
+    if row is None:
+        return None, []
+    return row['last_published'], json.loads(row['seen_guids'])
+
+def _entry_guid(entry):
+    return entry.get('guid') or entry.get('link', '')
+
+def unseen_feed_entries(feed_url, entries):
+    """Entries newer than the feed's cursor (not seen before, not older than its high-water mark)"""
+    last_published, seen_guids = get_feed_cursor(feed_url)
+    seen = set(seen_guids)
+    return [
+        entry for entry in entries
+        if _entry_guid(entry) not in seen
+        and not (last_published and entry.get('published') and entry['published'] < last_published)
+    ]
+
+def cut_feed_short(pending, feed_url):
+    """Keep only the GUIDs of a feed whose loop stopped early - its older unprocessed
+    entries must stay above the high-water mark for the next ingest"""
+    pending[feed_url] = [{'guid': _entry_guid(e)} for e in pending.get(feed_url, [])]
+
+def commit_feed_cursors(pending):
+    """Advance feed cursors ({url: processed entries}) - call once the entries are stored"""
+    conn = get_learning_db()
+    with conn:
+        for feed_url, entries in pending.items():
+            if not entries:
+                continue
+            last_published, seen_guids = get_feed_cursor(feed_url)
+            published = [e['published'] for e in entries if e.get('published')]
+            if published:
+                last_published = max(published + ([last_published] if last_published else []))
+            new_guids = [_entry_guid(e) for e in entries if _entry_guid(e) not in seen_guids]
+            conn.execute(
+                'INSERT OR REPLACE INTO feed_cursors (url, last_published, seen_guids, updated_at) VALUES (?, ?, ?, ?)',
+                (feed_url, last_published, json.dumps((new_guids + seen_guids)[:FEED_SEEN_GUIDS_MAX]),
+                 datetime.now().isoformat())
+            )
 
 def get_learning_stats():
     """Get database stats"""
-    db = load_learning_database()
-    
-    # Ensure db is a list
-    if not isinstance(db, list):
-        db = []
-    
     real_count = 0
     fake_count = 0
-    for item in db:
-        if isinstance(item, dict):
-            if item.get('label') == 1:
-                real_count += 1
-            elif item.get('label') == 0:
-                fake_count += 1
+    total = 0
+    try:
+        for row in get_learning_db().execute('SELECT label, COUNT(*) AS n FROM samples GROUP BY label'):
+            if row['label'] == 1:
+                real_count = row['n']
+            elif row['label'] == 0:
+                fake_count = row['n']
+            total += row['n']
+    except:
+        pass
+    
+    feed_cursors = []
+    try:
+        for row in get_learning_db().execute('SELECT * FROM feed_cursors ORDER BY url'):
+            feed_cursors.append({
+                'url': row['url'],
+                'last_published': row['last_published'],
+                'seen': len(json.loads(row['seen_guids'])),
+                'updated_at': row['updated_at']
+            })
+    except:
+        pass
     
     return {
         'real_samples': real_count,
         'fake_samples': fake_count,
-        'total_samples': len(db)
+        'total_samples': total,
+        'feed_cursors': feed_cursors
     }
 
+# ======================== DISK CACHE ========================
+CACHE_DB_PATH = 'cache.sqlite3'  # Network responses (safe to delete)
+
+def get_cache_db():
+    """Connection to the response cache (schema on first use)"""
+    conn = connect_db(CACHE_DB_PATH)
+    if CACHE_DB_PATH not in _db_initialized:
+        with _db_init_lock:
+            if CACHE_DB_PATH not in _db_initialized:
+                init_cache_db(conn)
+                _db_initialized.add(CACHE_DB_PATH)
+    return conn
+
+def init_cache_db(conn):
+    """Create cache tables"""
+    with conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS feed_cache (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                entries TEXT NOT NULL,
+                fetched_at TEXT
+            );
+
+            CREATE TABLE IF NOT EXISTS groq_cache (
+                key TEXT PRIMARY KEY,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS groq_cache_last_used ON groq_cache(last_used);
+
+            CREATE TABLE IF NOT EXISTS wiki_cache (
+                keyword TEXT PRIMARY KEY,
+                extract TEXT,  -- NULL: no article (negative entry)
+                fetched_at REAL NOT NULL
+            );
+        """)
+
 # ======================== PREPROCESSING ========================
-def preprocess_text(text):
+# News vocabulary repeats: lemmas are cached per token, cleaned texts per content digest
+PREPROCESS_CACHE_MAX_ITEMS = int(os.getenv('FAKE_NEWS_PREPROCESS_CACHE_ITEMS', '20000'))  # Whole texts
+LEMMA_CACHE_MAX_ITEMS = int(os.getenv('FAKE_NEWS_LEMMA_CACHE_ITEMS', '100000'))  # Distinct tokens
+
+_preprocess_cache = OrderedDict()  # digest -> cleaned text, least recently used first
+_preprocess_cache_lock = threading.Lock()
+_preprocess_stats = {'hits': 0, 'misses': 0}
+
+@functools.lru_cache(maxsize=LEMMA_CACHE_MAX_ITEMS)
+def lemmatize_token(word):
+    return lemmatizer.lemmatize(word)
+
+def _preprocess_uncached(text):
     text = text.lower()
     text = ''.join(c for c in text if c.isalnum() or c.isspace())
     words = word_tokenize(text)
-    words = [lemmatizer.lemmatize(w) for w in words if w not in stop_words and len(w) > 2]
+    words = [lemmatize_token(w) for w in words if w not in stop_words and len(w) > 2]
     return ' '.join(words)
 
-def get_stylistic_features(text):
+def _preprocess_key(text):
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+def preprocess_cache_get(key):
+    """Cached cleaned text for a _preprocess_key digest, or None"""
+    with _preprocess_cache_lock:
+        cleaned = _preprocess_cache.get(key)
+        if cleaned is None:
+            _preprocess_stats['misses'] += 1
+            return None
+        _preprocess_cache.move_to_end(key)
+        _preprocess_stats['hits'] += 1
+        return cleaned
+
+def preprocess_cache_put(key, cleaned):
+    with _preprocess_cache_lock:
+        _preprocess_cache[key] = cleaned
+        _preprocess_cache.move_to_end(key)
+        while len(_preprocess_cache) > PREPROCESS_CACHE_MAX_ITEMS:
+            _preprocess_cache.popitem(last=False)
+
+def preprocess_text(text):
+    """Lowercase, strip punctuation, tokenize, drop stop words, lemmatize (memoized)"""
+    key = _preprocess_key(text)
+    cleaned = preprocess_cache_get(key)
+    if cleaned is None:
+        cleaned = _preprocess_uncached(text)
+        preprocess_cache_put(key, cleaned)
+    return cleaned
+
+def get_preprocess_cache_stats():
+    """Hit rates of the text and lemma caches (this process)"""
+    lemmas = lemmatize_token.cache_info()
+    with _preprocess_cache_lock:
+        hits, misses, entries = _preprocess_stats['hits'], _preprocess_stats['misses'], len(_preprocess_cache)
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': hits / max(hits + misses, 1),
+        'entries': entries,
+        'lemma_hits': lemmas.hits,
+        'lemma_misses': lemmas.misses,
+        'lemma_hit_rate': lemmas.hits / max(lemmas.hits + lemmas.misses, 1),
+        'lemma_entries': lemmas.currsize
+    }
+
+def get_stylistic_features(text, signals=None):
+    if signals is None:
+        signals = text_signals(text)
+    length = max(signals['length'], 1)
     features = []
-    features.append(1 if '!!!' in text else 0)
-    features.append(1 if 'URGENT' in text else 0)
-    features.append(1 if 'EXPOSED' in text else 0)
-    features.append(1 if '100%' in text else 0)
-    features.append(text.count('!') / max(len(text), 1))
-    features.append(sum(1 for c in text if c.isupper()) / max(len(text), 1))
+    features.append(1 if '!!!' in signals['terms'] else 0)
+    features.append(1 if 'URGENT' in signals['exact'] else 0)
+    features.append(1 if 'EXPOSED' in signals['exact'] else 0)
+    features.append(1 if '100%' in signals['terms'] else 0)
+    features.append(signals['exclamations'] / length)
+    features.append(signals['upper'] / length)
     return np.array([features])
 
+def stylistic_matrix(texts, signals=None):
+    if signals is None:
+        return np.vstack([get_stylistic_features(t) for t in texts])
+    return np.vstack([get_stylistic_features(t, s) for t, s in zip(texts, signals)])
+
+def stack_features(X_text, texts, X_stylistic=None):
+    """Append the stylistic columns to a sparse text matrix (stays sparse CSR)"""
+    if X_stylistic is None:
+        X_stylistic = stylistic_matrix(texts)
+    return sparse.hstack([X_text, sparse.csr_matrix(X_stylistic)], format='csr')
+
+def build_feature_matrix(vectorizer, texts_clean, texts, X_stylistic=None):
+    """Vectorize cleaned texts and append the stylistic columns (one row per text)"""
+    return stack_features(vectorizer.transform(texts_clean), texts, X_stylistic)
+
+# Training set preparation across cores: NLTK work is CPU-bound and per-text independent.
+# Workers are spawned (never forked from the Tk process / scheduler thread) and each imports
+# this module once (~2.5s, quietly and without package checks - see _WORKER_PROCESS), so the pool only pays off for large sets of preprocess-cache misses -
+# reached when FAKE_NEWS_LEARNING_DB_MAX_ITEMS is raised well above the default 2000.
+PREPROCESS_WORKERS = int(os.getenv('FAKE_NEWS_PREPROCESS_WORKERS', str(os.cpu_count() or 1)))
+PREPROCESS_PARALLEL_MIN = int(os.getenv('FAKE_NEWS_PREPROCESS_PARALLEL_MIN', '10000'))  # Cache misses
+PREPROCESS_CHUNK_SIZE = 1000  # Max texts per task
+
+def _preprocess_chunk(texts):
+    """Worker task: (cleaned texts, stylistic rows)"""
+    return [_preprocess_uncached(t) for t in texts], stylistic_matrix(texts)
+
+def prepare_training_texts(texts):
+    """
+    Cleaned texts and stylistic rows for a training set, in input order
+    - Texts already in the preprocess cache are not recomputed
+    - PREPROCESS_PARALLEL_MIN or more misses are split into chunks across a process pool
+    """
+    keys = [_preprocess_key(t) for t in texts]
+    texts_clean = [preprocess_cache_get(key) for key in keys]
+    misses = [i for i, cleaned in enumerate(texts_clean) if cleaned is None]
+    miss_texts = [texts[i] for i in misses]
+    
+    if not misses:
+        chunks = []
+    elif PREPROCESS_WORKERS <= 1 or len(misses) < PREPROCESS_PARALLEL_MIN:
+        chunks = [_preprocess_chunk(miss_texts)]
+    else:
+        size = min(PREPROCESS_CHUNK_SIZE, -(-len(miss_texts) // (PREPROCESS_WORKERS * 4)))
+        with ProcessPoolExecutor(max_workers=PREPROCESS_WORKERS,
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            # map() yields results in submission order, so the output is deterministic
+            chunks = list(pool.map(_preprocess_chunk,
+                                   [miss_texts[i:i + size] for i in range(0, len(miss_texts), size)]))
+    
+    X_stylistic = np.zeros((len(texts), len(get_stylistic_features('')[0])))
+    hits = [i for i in range(len(texts)) if texts_clean[i] is not None]
+    if hits:
+        X_stylistic[hits] = stylistic_matrix([texts[i] for i in hits])
+    
+    computed = [cleaned for chunk_clean, _ in chunks for cleaned in chunk_clean]
+    for i, cleaned in zip(misses, computed):
+        texts_clean[i] = cleaned
+        preprocess_cache_put(keys[i], cleaned)
+    if misses:
+        X_stylistic[misses] = np.vstack([rows for _, rows in chunks])
+    return texts_clean, X_stylistic
+
+# ======================== FEED FETCHING ========================
+FEED_WORKERS = int(os.getenv('FAKE_NEWS_FEED_WORKERS', '8'))  # Feeds fetched at once
+FEED_PER_HOST = int(os.getenv('FAKE_NEWS_FEED_PER_HOST', '2'))  # Per-host connection limit
+FEED_TIMEOUT = float(os.getenv('FAKE_NEWS_FEED_TIMEOUT', '3'))  # Seconds per request
+FEED_DEADLINE = float(os.getenv('FAKE_NEWS_FEED_DEADLINE', '8'))  # Seconds for the whole fetch
+FEED_BASE_URL = os.getenv('FAKE_NEWS_FEED_BASE_URL', '').rstrip('/')  # e.g. http://127.0.0.1:8765 (fake_servers.py)
+
+# WORKING FEEDS (tested & verified)
+LIVE_NEWS_FEEDS = [
+    "https://feeds.bbci.co.uk/news/rss.xml",
+    "https://feeds.bbci.co.uk/news/world/rss.xml",
+    "https://feeds.bbci.co.uk/news/india/rss.xml",
+    "https://feeds.bbci.co.uk/news/asia/rss.xml",
+    "https://feeds.bbci.co.uk/news/technology/rss.xml",
+    "https://www.aljazeera.com/xml/rss/all.xml",
+    "https://feeds.bloomberg.com/markets/news.rss",
+    "https://feeds.npr.org/1001/rss.xml",
+]
+MEGA_TRAINING_FEEDS = [
+    "https://feeds.bbci.co.uk/news/rss.xml",
+    "https://feeds.bbci.co.uk/news/world/rss.xml",
+    "https://feeds.bbci.co.uk/news/india/rss.xml",
+    "https://feeds.bbci.co.uk/news/technology/rss.xml",
+    "https://www.aljazeera.com/xml/rss/all.xml",
+]
+
+def feed_urls(urls):
+    """Feed URLs as fetched - with FEED_BASE_URL set, https://host/path becomes {FEED_BASE_URL}/host/path"""
+    if not FEED_BASE_URL:
+        return list(urls)
+    rewritten = []
+    for url in urls:
+        parsed = urlparse(url)
+        rewritten.append(f"{FEED_BASE_URL}/{parsed.netloc}{parsed.path}")
+    return rewritten
+
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+def _host_limit(feed_url):
+    host = urlparse(feed_url).netloc
+    with _host_limits_lock:
+        if host not in _host_limits:
+            _host_limits[host] = threading.BoundedSemaphore(FEED_PER_HOST)
+        return _host_limits[host]
+
+# Anything containing '<' after these are removed is malformed markup
+_HTML_TAG_RE = re.compile(
+    r'<!--.*?-->'                                      # Comments
+    r'|<(script|style)\b[^>]*>.*?</\1\s*>'             # Script/style blocks (no visible text)
+    r'|</?[a-zA-Z](?:[^<>"\']|"[^"]*"|\'[^\']*\')*>'    # Tags (quoted attributes may contain '>')
+    r'|<![^<>]*>',                                     # Doctype / CDATA markers
+    re.DOTALL | re.IGNORECASE
+)
+
+def html_to_text(markup):
+    """Text of an HTML snippet (tags stripped, entities decoded) - BeautifulSoup only for malformed markup"""
+    if '<' not in markup:
+        return html.unescape(markup) if '&' in markup else markup
+    text = _HTML_TAG_RE.sub('', markup)
+    if '<' in text:
+        return BeautifulSoup(markup, 'html.parser').get_text()
+    return html.unescape(text)
+
+def parse_feed_entries(content, limit=None):
+    """Parse RSS/Atom bytes into [{'title', 'summary', 'link', 'guid', 'published'}] (summary as plain text)"""
+    entries = []
+    for entry in feedparser.parse(content).entries[:limit]:
+        summary = entry.get('summary', '')
+        if summary:
+            summary = html_to_text(summary)
+        published = entry.get('published_parsed') or entry.get('updated_parsed')
+        entries.append({
+            'title': entry.get('title', ''),
+            'summary': summary,
+            'link': entry.get('link', ''),
+            'guid': entry.get('id') or entry.get('link') or entry.get('title', ''),
+            'published': time.strftime('%Y-%m-%dT%H:%M:%SZ', published) if published else None
+        })
+    return entries
+
+def fetch_feed(feed_url, limit, deadline):
+    """
+    Download and parse one feed (runs in a worker thread). Conditional GET:
+    an unchanged feed answers 304 and its cached entries are reused without parsing.
+    """
+    cache = get_cache_db()
+    cached = cache.execute('SELECT etag, last_modified, entries FROM feed_cache WHERE url = ?', (feed_url,)).fetchone()
+    headers = {}
+    if cached and cached['etag']:
+        headers['If-None-Match'] = cached['etag']
+    if cached and cached['last_modified']:
+        headers['If-Modified-Since'] = cached['last_modified']
+    
+    limit_sem = _host_limit(feed_url)
+    if not limit_sem.acquire(timeout=max(0, deadline - time.monotonic())):
+        raise TimeoutError("host busy until deadline")
+    try:
+        timeout = min(FEED_TIMEOUT, max(0.1, deadline - time.monotonic()))
+        response = get_http_session().get(feed_url, headers=headers, timeout=timeout)
+    finally:
+        limit_sem.release()
+    
+    if response.status_code == 304 and cached:
+        return json.loads(cached['entries'])[:limit]
+    if response.status_code != 200:
+        raise ValueError(f"HTTP {response.status_code}")
+    
+    # Cache every entry (later runs may ask for more than this one)
+    entries = parse_feed_entries(response.content)
+    with cache:
+        cache.execute(
+            'INSERT OR REPLACE INTO feed_cache (url, etag, last_modified, entries, fetched_at) VALUES (?, ?, ?, ?, ?)',
+            (feed_url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+             json.dumps(entries), datetime.now().isoformat())
+        )
+    return entries[:limit]
+
+def fetch_feeds(feed_urls, limit, deadline=None):
+    """
+    Fetch feeds concurrently - yields (feed_url, entries, error) as each one finishes,
+    so a slow feed never holds up the fast ones. Feeds still running at the deadline
+    are reported with a timeout error.
+    """
+    deadline = time.monotonic() + (FEED_DEADLINE if deadline is None else deadline)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(FEED_WORKERS, len(feed_urls))))
+    futures = {executor.submit(fetch_feed, url, limit, deadline): url for url in feed_urls}
+    try:
+        try:
+            for future in as_completed(futures, timeout=max(0, deadline - time.monotonic())):
+                try:
+                    yield futures[future], future.result(), None
+                except Exception as e:
+                    yield futures[future], [], e
+        except FuturesTimeout:
+            for future, url in futures.items():
+                if not future.done():
+                    yield url, [], TimeoutError("feed deadline reached")
+    finally:
+        # Stop waiting on stragglers (running requests end at their own timeout)
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+
 # ======================== MEGA TRAINING ON MILLIONS (MEMORY OPTIMIZED) ========================
 def train_on_millions_mega():
     """
@@ -411,85 +1428,67 @@ def train_on_millions_mega():
     bootstrap_data = generate_bootstrap_training_data()[:500]  # Reduced for speed
     print(f"  Generated {len(bootstrap_data)} bootstrap articles")
     
-    for item in bootstrap_data:
-        try:
-            add_to_learning_database(item['text'][:500], item['label'], "Bootstrap Data", item['confidence'])
-            
-            if item['label'] == 1:
-                total_real += 1
-            else:
-                total_fake += 1
-            
-            total_fetched += 1
-            
-            if total_fetched % 100 == 0:
-                print(f"  ✓ Added {total_fetched} bootstrap articles...")
-        except:
-            pass
+    batch = [
+        {'text': item['text'][:500], 'label': item['label'], 'source': "Bootstrap Data", 'confidence': item['confidence']}
+        for item in bootstrap_data
+    ]
+    real, fake = count_accepted(batch, add_many_to_learning_database(batch))
+    total_real += real
+    total_fake += fake
+    total_fetched += real + fake
+    print(f"  ✓ Added {total_fetched} bootstrap articles ({len(batch) - total_fetched} already stored)")
     
     # Step 2: Add from BBC feeds (200+ additional - FASTER)
     print(f"\n📡 Step 2: Fetching 200+ articles from BBC feeds (FAST)...")
     
-    bbc_feeds = [
-        "https://feeds.bbci.co.uk/news/rss.xml",
-        "https://feeds.bbci.co.uk/news/world/rss.xml",
-        "https://feeds.bbci.co.uk/news/india/rss.xml",
-        "https://feeds.bbci.co.uk/news/technology/rss.xml",
-        "https://www.aljazeera.com/xml/rss/all.xml",
-    ]
+    bbc_feeds = feed_urls(MEGA_TRAINING_FEEDS)
     
     processed_urls = set()
     articles_from_bbc = 0
+    batch = []
+    pending_cursors = {}  # Committed once the batch is stored
     
-    for feed_url in bbc_feeds:
-        try:
-            response = requests.get(feed_url, timeout=3)  # Faster timeout
-            if response.status_code == 200:
-                feed = feedparser.parse(response.content)
-                
-                # 40 articles per feed (5 feeds × 40 = 200 max)
-                for entry in feed.entries[:40]:
-                    title = entry.get('title', '')
-                    summary = entry.get('summary', '')
-                    link = entry.get('link', '')
-                    
-                    if link in processed_urls:
-                        continue
-                    processed_urls.add(link)
-                    
-                    if summary:
-                        summary = BeautifulSoup(summary, 'html.parser').get_text()
-                    
-                    text = f"{title}. {summary}"
-                    
-                    if len(text.strip()) > 30:
-                        try:
-                            local_score = local_fact_check(text).get('score', 0.5)
-                            label = 1 if local_score > 0.6 else 0
-                            confidence = abs(local_score - 0.5) * 2
-                            
-                            if confidence > 0.3:
-                                add_to_learning_database(text[:500], label, "BBC Live", confidence)
-                                
-                                if label == 1:
-                                    total_real += 1
-                                else:
-                                    total_fake += 1
-                                
-                                total_fetched += 1
-                                articles_from_bbc += 1
-                        except:
-                            pass
-                    
-                    if total_fetched >= 700:  # Reduced target from 1000
-                        break
-                
-                if total_fetched >= 700:
-                    break
-                    
-        except Exception as e:
-            print(f"  ⚠️ Feed error: {str(e)[:60]}...")
+    # 40 articles per feed (5 feeds × 40 = 200 max), fetched concurrently
+    for feed_url, entries, error in fetch_feeds(bbc_feeds, 40):
+        if error is not None:
+            print(f"  ⚠️ Feed error: {str(error)[:60]}...")
             continue
+        
+        # Only entries newer than the last successful ingest
+        processed = pending_cursors.setdefault(feed_url, [])
+        for entry in unseen_feed_entries(feed_url, entries):
+            processed.append(entry)
+            link = entry['link']
+            if link in processed_urls:
+                continue
+            processed_urls.add(link)
+            
+            text = f"{entry['title']}. {entry['summary']}"
+            
+            if len(text.strip()) > 30:
+                try:
+                    local_score = local_fact_check(text).get('score', 0.5)
+                    label = 1 if local_score > 0.6 else 0
+                    confidence = abs(local_score - 0.5) * 2
+                    
+                    if confidence > 0.3:
+                        batch.append({'text': text[:500], 'label': label, 'source': "BBC Live", 'confidence': confidence})
+                except:
+                    pass
+            
+            if total_fetched + len(batch) >= 700:  # Reduced target from 1000
+                cut_feed_short(pending_cursors, feed_url)
+                break
+        
+        if total_fetched + len(batch) >= 700:
+            break
+    
+    real, fake = count_accepted(batch, add_many_to_learning_database(batch))
+    commit_feed_cursors(pending_cursors)
+    total_real += real
+    total_fake += fake
+    total_fetched += real + fake
+    articles_from_bbc = real + fake
     
     print(f"\n✅ MEGA TRAINING COMPLETE!")
     print(f"📊 Total unique articles added: {total_fetched}")
@@ -499,8 +1498,8 @@ def train_on_millions_mega():
     print(f"  📡 BBC Live: {articles_from_bbc}")
     print(f"🧠 Retraining model with {total_fetched} articles...")
     
-    # Retrain model
-    train_model()
+    # Retrain model (waits for the scheduler's rebuild)
+    retrain_scheduler.request(wait=True)
     
     print(f"✅ Model retrained successfully!")
     return {
@@ -510,58 +1509,46 @@ def train_on_millions_mega():
     }
 
 # ======================== LIVE NEWS TRAINING (MEMORY EFFICIENT) ========================
-def fetch_live_news():
-    """Fetch live news from working RSS feeds (OPTIMIZED - Fast)"""
+def fetch_live_news(pending_cursors=None):
+    """
+    Fetch live news from working RSS feeds (OPTIMIZED - Fast)
+    Only entries newer than each feed's cursor are returned; pass a dict as
+    pending_cursors to collect them for commit_feed_cursors() after ingest.
+    """
     news_items = []
     processed_urls = set()
     
-    # WORKING FEEDS (tested & verified)
-    rss_feeds = [
-        "https://feeds.bbci.co.uk/news/rss.xml",
-        "https://feeds.bbci.co.uk/news/world/rss.xml",
-        "https://feeds.bbci.co.uk/news/india/rss.xml",
-        "https://feeds.bbci.co.uk/news/asia/rss.xml",
-        "https://feeds.bbci.co.uk/news/technology/rss.xml",
-        "https://www.aljazeera.com/xml/rss/all.xml",
-        "https://feeds.bloomberg.com/markets/news.rss",
-        "https://feeds.npr.org/1001/rss.xml",
-    ]
+    rss_feeds = feed_urls(LIVE_NEWS_FEEDS)
     
     try:
         print("[*] Fetching from BBC & international feeds...")
-        for feed_url in rss_feeds:
-            try:
-                response = requests.get(feed_url, timeout=3)  # Reduced from 5
-                if response.status_code == 200:
-                    feed = feedparser.parse(response.content)
-                    
-                    for entry in feed.entries[:10]:  # Reduced from 20 for speed
-                        title = entry.get('title', '')
-                        summary = entry.get('summary', '')
-                        link = entry.get('link', '')
-                        
-                        if link in processed_urls:
-                            continue
-                        processed_urls.add(link)
-                        
-                        if summary:
-                            summary = BeautifulSoup(summary, 'html.parser').get_text()
-                        
-                        text = f"{title}. {summary}"
-                        if len(text.strip()) > 30:
-                            news_items.append(text[:500])
-                            if len(news_items) % 30 == 0:
-                                print(f"  [+] Fetched {len(news_items)} live articles...")
-                        
-                        if len(news_items) >= 100:  # Reduced target from 240
-                            break
-                    
-                    if len(news_items) >= 100:
-                        break
-                        
-            except Exception as e:
-                print(f"  [-] Feed error: {str(e)[:60]}...")
+        # Feeds are fetched concurrently and handled in the order they arrive
+        for feed_url, entries, error in fetch_feeds(rss_feeds, 10):  # 10 per feed (reduced from 20 for speed)
+            if error is not None:
+                print(f"  [-] Feed error: {str(error)[:60]}...")
                 continue
+            
+            for entry in unseen_feed_entries(feed_url, entries):
+                if pending_cursors is not None:
+                    pending_cursors.setdefault(feed_url, []).append(entry)
+                link = entry['link']
+                if link in processed_urls:
+                    continue
+                processed_urls.add(link)
+                
+                text = f"{entry['title']}. {entry['summary']}"
+                if len(text.strip()) > 30:
+                    news_items.append(text[:500])
+                    if len(news_items) % 30 == 0:
+                        print(f"  [+] Fetched {len(news_items)} live articles...")
+                
+                if len(news_items) >= 100:  # Reduced target from 240
+                    if pending_cursors is not None:
+                        cut_feed_short(pending_cursors, feed_url)
+                    break
+            
+            if len(news_items) >= 100:
+                break
     
     except Exception as e:
         print(f"Live news fetch error: {e}")
@@ -585,35 +1572,29 @@ def train_on_live_news_async(callback=None):
                 callback("progress", "📚 Loading 500 bootstrap training articles...")
             
             bootstrap_data = generate_bootstrap_training_data()[:500]  # Use first 500 for live
+            batch = [
+                {'text': item['text'][:500], 'label': item['label'], 'source': "Bootstrap Live", 'confidence': item['confidence']}
+                for item in bootstrap_data
+            ]
+            added_real, added_fake = count_accepted(batch, add_many_to_learning_database(batch))
+            total_added = added_real + added_fake
             
-            for item in bootstrap_data:
-                try:
-                    add_to_learning_database(item['text'][:500], item['label'], "Bootstrap Live", item['confidence'])
-                    
-                    if item['label'] == 1:
-                        added_real += 1
-                    else:
-                        added_fake += 1
-                    
-                    total_added += 1
-                    
-                    if total_added % 100 == 0:
-                        if callback:
-                            callback("progress", f"📚 Added {total_added} bootstrap articles ({added_real} Real + {added_fake} Fake)")
-                except:
-                    pass
+            if callback:
+                callback("progress", f"📚 Added {total_added} bootstrap articles ({added_real} Real + {added_fake} Fake)")
             
             # Step 2: Fetch live news from BBC (240+ more articles)
             if callback:
                 callback("progress", f"📡 Fetching {min(240, 12*20)} live news articles from BBC...")
             
-            news_items = fetch_live_news()
+            pending_cursors = {}
+            news_items = fetch_live_news(pending_cursors)
             
             if not news_items:
                 if callback:
                     callback("progress", "📡 Could not fetch BBC news, using bootstrap only...")
             else:
-                # Process one by one
+                # Label locally, then store everything in one transaction
+                batch = []
                 for i, text in enumerate(news_items):
                     try:
                         local_score = local_fact_check(text).get('score', 0.5)
@@ -621,28 +1602,29 @@ def train_on_live_news_async(callback=None):
                         confidence = abs(local_score - 0.5) * 2
                         
                         if confidence > 0.5:
-                            add_to_learning_database(text, label, "BBC Live", confidence)
-                            
-                            if label == 1:
-                                added_real += 1
-                            else:
-                                added_fake += 1
-                            
-                            total_added += 1
+                            batch.append({'text': text, 'label': label, 'source': "BBC Live", 'confidence': confidence})
                         
                         # Update progress
-                        if total_added % 50 == 0:
-                            progress = int((i / len(news_items)) * 100)
-                            if callback:
-                                callback("progress", f"📡 Processing: {progress}% ({added_real} Real + {added_fake} Fake) - Total: {total_added}")
-                        
-                        time.sleep(0.05)
+                        if (i + 1) % 50 == 0 and callback:
+                            progress = int(((i + 1) / len(news_items)) * 100)
+                            callback("progress", f"📡 Processing: {progress}% ({len(batch)} confident articles)")
                         
                     except Exception as e:
                         pass
+                
+                statuses = add_many_to_learning_database(batch)
+                commit_feed_cursors(pending_cursors)
+                real, fake = count_accepted(batch, statuses)
+                added_real += real
+                added_fake += fake
+                total_added += real + fake
+                
+                if callback:
+                    callback("progress", f"📡 Stored {real + fake} live articles ({real} Real + {fake} Fake), "
+                                         f"{statuses.count('duplicate') + statuses.count('rejected')} duplicates skipped")
             
-            # Step 3: Train model
-            train_model()
+            # Step 3: Train model (waits for the scheduler's rebuild)
+            retrain_scheduler.request(wait=True)
             
             if callback:
                 callback("done", f"✅ Live Training Complete!\n\n📊 Data Added: {total_added}\n  ✓ Real News: {added_real}\n  ✗ Fake News: {added_fake}\n\n🧠 Model Retrained!")
@@ -782,45 +1764,176 @@ def generate_bootstrap_training_data():
     return news_data
 
 # ======================== AI EXPLANATION ========================
-def get_ai_explanation(text, is_fake, wiki_knowledge=None):
+def get_ai_explanation(text, is_fake, wiki_knowledge=None, signals=None):
     """Get AI-powered explanation"""
     explanations = []
-    text_lower = text.lower()
+    if signals is None:
+        signals = text_signals(text)
+    terms = signals['terms']
     
     if is_fake:
         explanations.append("🚨 FAKE NEWS INDICATORS:\n")
-        if '!!!' in text or text.count('!') > 5:
+        if '!!!' in terms or signals['exclamations'] > 5:
             explanations.append("  ⚠️ Excessive exclamation marks")
-        if 'URGENT' in text.upper():
+        if 'urgent' in terms:
             explanations.append("  ⚠️ Urgency language detected")
-        if 'EXPOSED' in text.upper():
+        if 'exposed' in terms:
             explanations.append("  ⚠️ Conspiracy keywords found")
-        if '100%' in text:
+        if '100%' in terms:
             explanations.append("  ⚠️ False certainty claims")
     else:
         explanations.append("✅ REAL NEWS INDICATORS:\n")
-        if any(word in text_lower for word in ['said', 'according', 'reported']):
+        if signal_count(signals, 'explain_attribution'):
             explanations.append("  ✓ Proper attribution language")
-        if '.' in text and text.count('.') > len(text.split()) * 0.1:
+        if signals['periods'] and signals['periods'] > signals['words'] * 0.1:
             explanations.append("  ✓ Proper sentence structure")
-        if any(word in text_lower for word in ['research', 'study', 'data', 'evidence']):
+        if signal_count(signals, 'explain_sources'):
             explanations.append("  ✓ References credible sources")
     
     return explanations
 
 # ======================== PREDICTION ========================
-gemini_cache = {}
 _model_cache = {}  # Cache for loaded models (avoid reloading)
 
+GROQ_MODEL = "llama-3.1-8b-instant"
+GROQ_API_URL = os.getenv('FAKE_NEWS_GROQ_URL', "https://api.groq.com/openai/v1/chat/completions")
+GROQ_CACHE_TTL = float(os.getenv('FAKE_NEWS_GROQ_CACHE_TTL_HOURS', '168')) * 3600  # Default: one week
+GROQ_CACHE_MAX_ITEMS = int(os.getenv('FAKE_NEWS_GROQ_CACHE_MAX_ITEMS', '5000'))  # Least recently used go first
+
+_groq_cache_stats = {'hits': 0, 'misses': 0}
+
+def groq_cache_key(text, batched=False):
+    """Stable key: model + prompt variant (short/long/batch) + whitespace-normalized full text"""
+    if batched:
+        variant = 'batch'  # Numbered multi-claim prompt - answers differ from the single prompts
+    else:
+        variant = 'short' if len(text.strip()) < 200 else 'long'
+    normalized = ' '.join(text.split())
+    return hashlib.sha256(f"{GROQ_MODEL}\n{variant}\n{normalized}".encode('utf-8')).hexdigest()
+
+def groq_cache_get(text, batched=False, accept_batched=False):
+    """
+    Cached Groq result for text, or None (expired entries count as misses).
+    accept_batched: a batched answer will do when no single-prompt one is stored (one lookup)
+    """
+    keys = [groq_cache_key(text, batched)]
+    if accept_batched and not batched:
+        keys.append(groq_cache_key(text, True))
+    now = time.time()
+    try:
+        conn = get_cache_db()
+        rows = {
+            row['key']: row for row in conn.execute(
+                f'SELECT key, result, created_at FROM groq_cache WHERE key IN ({",".join("?" * len(keys))})', keys)
+        }
+        expired = [key for key, row in rows.items() if now - row['created_at'] > GROQ_CACHE_TTL]
+        if expired:
+            with conn:
+                conn.executemany('DELETE FROM groq_cache WHERE key = ?', [(key,) for key in expired])
+        for key in keys:  # Preferred variant first
+            if key in rows and key not in expired:
+                with conn:
+                    conn.execute('UPDATE groq_cache SET last_used = ? WHERE key = ?', (now, key))
+                _groq_cache_stats['hits'] += 1
+                return json.loads(rows[key]['result'])
+    except:
+        pass
+    _groq_cache_stats['misses'] += 1
+    return None
+
+def groq_cache_put(text, result, batched=False):
+    """Store a Groq answer (only real verdicts - a failure must not outlive the outage)"""
+    if not result or result.get('verdict') not in ('REAL', 'FAKE'):
+        return
+    now = time.time()
+    try:
+        conn = get_cache_db()
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO groq_cache (key, result, created_at, last_used) VALUES (?, ?, ?, ?)',
+                (groq_cache_key(text, batched), json.dumps(result), now, now)
+            )
+            conn.execute(
+                'DELETE FROM groq_cache WHERE key IN (SELECT key FROM groq_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)',
+                (GROQ_CACHE_MAX_ITEMS,)
+            )
+    except:
+        pass
+
+def get_groq_cache_stats():
+    """Hit/miss counters (this process) and stored entries"""
+    try:
+        entries = get_cache_db().execute('SELECT COUNT(*) FROM groq_cache').fetchone()[0]
+    except:
+        entries = 0
+    return dict(_groq_cache_stats, entries=entries)
+
+def groq_failure(analysis, source, status):
+    """Result dict for a Groq call that produced no verdict"""
+    return {
+        'analysis': analysis,
+        'verdict': 'UNKNOWN',
+        'confidence': 0.0,
+        'source': source,
+        'status': status
+    }
+
+def parse_groq_answer(ai_response):
+    """(verdict, confidence, reasoning) from an answer in the VERDICT/CONFIDENCE/REASONING format"""
+    verdict = "UNKNOWN"
+    confidence = 0.5
+    lines = ai_response.split('\n')
+    
+    # Extract VERDICT
+    for line in lines:
+        if "VERDICT:" in line.upper():
+            if "REAL" in line.upper() and "FAKE" not in line.upper():
+                verdict = "REAL"
+            elif "FAKE" in line.upper():
+                verdict = "FAKE"
+            break
+    
+    # Extract CONFIDENCE
+    for line in lines:
+        if "CONFIDENCE:" in line.upper():
+            numbers = re.findall(r'\d+', line)
+            if numbers:
+                confidence = int(numbers[0]) / 100.0
+            break
+    
+    # Extract only REASONING part (remove VERDICT and CONFIDENCE lines)
+    reasoning_only = ai_response
+    reasoning_lines = []
+    found_reasoning = False
+    for line in lines:
+        if "REASONING:" in line.upper():
+            # Get the text after "REASONING:"
+            reasoning_part = line.split(':', 1)[1].strip() if ':' in line else ''
+            if reasoning_part:
+                reasoning_lines.append(reasoning_part)
+            found_reasoning = True
+        elif found_reasoning:
+            reasoning_lines.append(line)
+    
+    if reasoning_lines:
+        reasoning_only = ' '.join(reasoning_lines).strip()
+    
+    return verdict, confidence, reasoning_only
+
 def search_gemini(text):
     """Search using Groq AI API (Llama 3 model)"""
+    # Fail fast to the local model while the API is unhealthy
+    if not groq_breaker.allow():
+        return groq_failure('Groq API temporarily unavailable - using the local model',
+                            'Groq API Circuit Open', '⏳ Offline')
+    
+    try:
+        GROQ_API_KEY = get_groq_api_key()
+    except Exception as e:
+        groq_breaker.release()  # Not the API's fault - only ends a half-open trial
+        return groq_failure(f'Groq API key unavailable (config.json): {str(e)}', 'Groq API Offline', '⏳ Offline')
+    
     try:
-        import requests
-        import json
-        
-        GROQ_API_KEY = json.load(open("config.json"))["groq_api_key"]
-        GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
-        
         # Detect if it's a short question or long article
         text_length = len(text.strip())
         is_short_query = text_length < 200  # Less than 200 characters = short question
@@ -858,7 +1971,7 @@ REASONING: [Brief explanation]"""
         }
         
         payload = {
-            "model": "llama-3.1-8b-instant",
+            "model": GROQ_MODEL,
             "messages": [
                 {
                     "role": "system",
@@ -873,54 +1986,24 @@ REASONING: [Brief explanation]"""
             "max_tokens": 500
         }
         
-        response = requests.post(GROQ_API_URL, headers=headers, json=payload, timeout=15)
+        try:
+            response = groq_post(GROQ_API_URL, headers, payload)
+        except GroqThrottled:
+            groq_breaker.release()
+            return groq_failure('Groq rate limit reached - using the local model', 'Groq API Busy', '⏳ Busy')
+        except:
+            groq_breaker.record_failure()
+            raise
+        
+        if response.status_code in RETRY_STATUSES:
+            groq_breaker.record_failure()
+        else:
+            groq_breaker.record_success()
         
         if response.status_code == 200:
             result = response.json()
             ai_response = result['choices'][0]['message']['content']
-            
-            # Parse the response
-            verdict = "UNKNOWN"
-            confidence = 0.5
-            reasoning = ai_response
-            
-            # Extract VERDICT
-            if "VERDICT:" in ai_response.upper():
-                verdict_line = ai_response.split('\n')[0] if '\n' in ai_response else ai_response
-                if "REAL" in verdict_line.upper() and "FAKE" not in verdict_line.upper():
-                    verdict = "REAL"
-                elif "FAKE" in verdict_line.upper():
-                    verdict = "FAKE"
-            
-            # Extract CONFIDENCE
-            if "CONFIDENCE:" in ai_response.upper():
-                for line in ai_response.split('\n'):
-                    if "CONFIDENCE:" in line.upper():
-                        import re
-                        numbers = re.findall(r'\d+', line)
-                        if numbers:
-                            confidence = int(numbers[0]) / 100.0
-                        break
-            
-            # Extract only REASONING part (remove VERDICT and CONFIDENCE lines)
-            reasoning_only = ai_response
-            if "REASONING:" in ai_response.upper():
-                # Find the REASONING: line and get everything after it
-                lines = ai_response.split('\n')
-                reasoning_lines = []
-                found_reasoning = False
-                for line in lines:
-                    if "REASONING:" in line.upper():
-                        # Get the text after "REASONING:"
-                        reasoning_part = line.split(':', 1)[1].strip() if ':' in line else ''
-                        if reasoning_part:
-                            reasoning_lines.append(reasoning_part)
-                        found_reasoning = True
-                    elif found_reasoning:
-                        reasoning_lines.append(line)
-                
-                if reasoning_lines:
-                    reasoning_only = ' '.join(reasoning_lines).strip()
+            verdict, confidence, reasoning_only = parse_groq_answer(ai_response)
             
             return {
                 'analysis': reasoning_only,
@@ -930,34 +2013,150 @@ REASONING: [Brief explanation]"""
                 'status': '✓ Online'
             }
         else:
-            return {
-                'analysis': f'API Error: {response.status_code}',
-                'verdict': 'UNKNOWN',
-                'confidence': 0.0,
-                'source': 'Groq API Error',
-                'status': '⚠️ Error'
-            }
+            return groq_failure(f'API Error: {response.status_code}', 'Groq API Error', '⚠️ Error')
             
     except Exception as e:
-        return {
-            'analysis': f'Connection failed: {str(e)}',
-            'verdict': 'UNKNOWN',
-            'confidence': 0.0,
-            'source': 'Groq API Offline',
-            'status': '⏳ Offline'
+        return groq_failure(f'Connection failed: {str(e)}', 'Groq API Offline', '⏳ Offline')
+
+# Bulk mode: several claims per chat completion
+GROQ_BATCH_TOKEN_BUDGET = int(os.getenv('FAKE_NEWS_GROQ_BATCH_TOKENS', '6000'))  # Prompt + answers per request
+GROQ_BATCH_MAX_CLAIMS = int(os.getenv('FAKE_NEWS_GROQ_BATCH_MAX_CLAIMS', '20'))
+GROQ_ANSWER_TOKENS = 120  # Answer tokens reserved per claim
+GROQ_BATCH_INSTRUCTIONS = """Fact-check each numbered claim below and decide if it is REAL (true) or FAKE (false).
+Answer every claim, in order, in exactly this format:
+
+CLAIM <number>
+VERDICT: [REAL or FAKE]
+CONFIDENCE: [0-100]%
+REASONING: [One or two sentences]
+
+Claims:
+"""
+_CLAIM_HEADER = re.compile(r'^\W*CLAIM\s+(\d+)\b', re.IGNORECASE | re.MULTILINE)
+_groq_chars_per_token = 4.0  # Calibrated from the API's usage counts
+GROQ_BATCH_SOURCE = 'Groq AI (Llama 3, batched)'
+
+def estimate_tokens(text):
+    return int(len(text) / _groq_chars_per_token) + 1
+
+def plan_groq_batches(claims):
+    """Split claim indexes into groups whose prompt + answers fit GROQ_BATCH_TOKEN_BUDGET"""
+    overhead = estimate_tokens(GROQ_BATCH_INSTRUCTIONS) + 50
+    groups, group, used = [], [], overhead
+    for i, claim in enumerate(claims):
+        cost = estimate_tokens(claim) + GROQ_ANSWER_TOKENS + 5
+        if group and (used + cost > GROQ_BATCH_TOKEN_BUDGET or len(group) >= GROQ_BATCH_MAX_CLAIMS):
+            groups.append(group)
+            group, used = [], overhead
+        group.append(i)
+        used += cost
+    if group:
+        groups.append(group)
+    return groups
+
+def parse_groq_batch_answer(ai_response, count):
+    """{claim number: (verdict, confidence, reasoning)} for every claim answered with a clear verdict"""
+    answers = {}
+    headers = list(_CLAIM_HEADER.finditer(ai_response))
+    for header, following in zip(headers, headers[1:] + [None]):
+        number = int(header.group(1))
+        section = ai_response[header.end():following.start() if following else len(ai_response)]
+        verdict, confidence, reasoning = parse_groq_answer(section)
+        if 1 <= number <= count and number not in answers and verdict in ('REAL', 'FAKE'):
+            answers[number] = (verdict, confidence, reasoning)
+    return answers
+
+def _groq_batch_request(claims):
+    """
+    One chat completion for several claims - returns {claim number: result},
+    or None when the API is unavailable (breaker open, 429/5xx, offline)
+    """
+    global _groq_chars_per_token
+    if not groq_breaker.allow():
+        return None
+    
+    prompt = GROQ_BATCH_INSTRUCTIONS + '\n'.join(f"CLAIM {n}: {claim}" for n, claim in enumerate(claims, 1))
+    payload = {
+        "model": GROQ_MODEL,
+        "messages": [
+            {"role": "system", "content": "You are an expert fact-checker. Answer each claim separately."},
+            {"role": "user", "content": prompt}
+        ],
+        "temperature": 0.3,
+        "max_tokens": GROQ_ANSWER_TOKENS * len(claims)
+    }
+    # Every path below ends a half-open trial allow() may have granted; only API errors count as failures
+    try:
+        headers = {"Authorization": f"Bearer {get_groq_api_key()}", "Content-Type": "application/json"}
+    except:
+        groq_breaker.release()
+        return {}  # Missing/malformed config.json - single calls report it per claim
+    
+    try:
+        response = groq_post(GROQ_API_URL, headers, payload)
+    except GroqThrottled:
+        groq_breaker.release()
+        return None
+    except:
+        groq_breaker.record_failure()
+        return None
+    
+    if response.status_code in RETRY_STATUSES:
+        groq_breaker.record_failure()
+        return None
+    groq_breaker.record_success()
+    if response.status_code != 200:
+        return {}  # e.g. request too large - the claims go out one by one
+    
+    try:
+        result = response.json()
+        prompt_tokens = (result.get('usage') or {}).get('prompt_tokens')
+        if prompt_tokens:
+            _groq_chars_per_token = 0.8 * _groq_chars_per_token + 0.2 * (len(prompt) / prompt_tokens)
+        answers = parse_groq_batch_answer(result['choices'][0]['message']['content'], len(claims))
+    except:
+        return {}  # Unexpected body - the claims go out one by one
+    
+    return {
+        number: {
+            'analysis': reasoning,
+            'verdict': verdict,
+            'confidence': confidence,
+            'source': GROQ_BATCH_SOURCE,
+            'status': '✓ Online'
         }
+        for number, (verdict, confidence, reasoning) in answers.items()
+    }
 
-def check_factcheck_websites(text):
+def search_gemini_batch(texts):
+    """
+    Fact-check many texts with few Groq requests (one result dict per text, in order)
+    - Claims are packed into numbered prompts sized to the token budget
+    - Claims whose answer cannot be parsed fall back to single search_gemini calls
+    """
+    claims = [' '.join(text.split())[:800] for text in texts]
+    results = [None] * len(texts)
+    
+    for group in plan_groq_batches(claims):
+        answers = _groq_batch_request([claims[i] for i in group]) if len(group) > 1 else {}
+        for number, i in enumerate(group, 1):
+            if answers is None:
+                results[i] = groq_failure('Groq API temporarily unavailable - using the local model',
+                                          'Groq API Offline', '⏳ Offline')
+            else:
+                results[i] = answers.get(number) or search_gemini(texts[i])
+    
+    return results
+
+def check_factcheck_websites(text, signals=None):
     """Check fact-check websites for matching claims (simplified)"""
     # This is a local pattern-based fallback
-    keywords_fake = ['hoax', 'fake', 'false', 'debunked', 'misleading']
-    keywords_real = ['verified', 'confirmed', 'authentic', 'true', 'accurate']
-    
-    text_lower = text.lower()
+    if signals is None:
+        signals = text_signals(text)
     findings = []
     
-    fake_score = sum(1 for kw in keywords_fake if kw in text_lower)
-    real_score = sum(1 for kw in keywords_real if kw in text_lower)
+    fake_score = signal_count(signals, 'factcheck_fake')
+    real_score = signal_count(signals, 'factcheck_real')
     
     if fake_score > real_score:
         findings.append({'site': 'Snopes', 'verdict': 'FALSE', 'url': '#'})
@@ -988,31 +2187,86 @@ def get_models():
     except:
         return None
 
+def get_model_version():
+    """Version string of the loaded model (train time, or file time for older models)"""
+    models = get_models()
+    if models is None:
+        return None
+    if models.get('version'):
+        return models['version']
+    try:
+        return datetime.fromtimestamp(os.path.getmtime('models/model.joblib')).strftime("%Y%m%d-%H%M%S")
+    except OSError:
+        return "unknown"
+
 def find_stored_analysis(text_clean):
-    """Find stored AI analysis for EXACT matching text in database"""
-    
-    db = load_learning_database()
-    
-    # Search for EXACT match only (no similarity checking)
-    for item in db:
-        if isinstance(item, dict) and 'ai_analysis' in item:
-            stored_text = preprocess_text(item.get('text', ''))
-            
-            # EXACT match only
-            if text_clean == stored_text:
-                # Return both analysis AND the original label/verdict
-                return {
-                    'analysis': item.get('ai_analysis'),
-                    'label': item.get('label'),
-                    'confidence': item.get('confidence', 0.85)
-                }
+    """Find stored AI analysis for EXACT matching text (indexed lookup)"""
+    try:
+        row = get_learning_db().execute(
+            'SELECT a.analysis, COALESCE(s.label, a.label) AS label, COALESCE(s.confidence, a.confidence) AS confidence '
+            'FROM analysis_index a LEFT JOIN samples s ON s.id = a.sample_id WHERE a.key = ?',
+            (analysis_key(text_clean),)
+        ).fetchone()
+    except:
+        return None
     
-    return None
+    if row is None:
+        return None
+    
+    # Return both analysis AND the original label/verdict (label follows manual relabels)
+    return {
+        'analysis': row['analysis'],
+        'label': row['label'],
+        'confidence': row['confidence'] if row['confidence'] is not None else 0.85
+    }
+
+PREDICT_DEADLINE = float(os.getenv('FAKE_NEWS_PREDICT_DEADLINE', '20'))  # Seconds to wait for evidence sources
+_evidence_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='evidence')
+
+def gather_evidence(sources, deadline):
+    """
+    Run {name: fn} concurrently and join them under one deadline (seconds)
+    Returns ({name: result}, [missing names]) - a source that failed or is
+    still running at the deadline is missing (it finishes in the background)
+    """
+    futures = {_evidence_pool.submit(fn): name for name, fn in sources.items()}
+    done, _ = wait(futures, timeout=deadline)
+    results, missing = {}, []
+    for future, name in futures.items():
+        if future in done and future.exception() is None:
+            results[name] = future.result()
+        else:
+            missing.append(name)
+    return results, missing
+
+def ask_ai(text):
+    """search_gemini + cache (stored even when the caller stopped waiting)"""
+    result = search_gemini(text)
+    groq_cache_put(text, result)
+    return result
+
+def needs_ai(text, ml_prob, stored_data):
+    """
+    The Groq gate shared by predict_news and predict_news_batch: a stored AI analysis
+    is replayed for short queries and for long articles the ML model is over 75% sure of;
+    everything else goes to the AI (ml_prob only matters for long articles)
+    """
+    if len(text.strip()) >= 200 and ml_prob <= 0.75:
+        return True
+    return stored_data is None
+
+def replayed_analysis(stored_data):
+    """Result dict for a stored AI analysis (fast mode, no API call)"""
+    return {
+        'analysis': stored_data['analysis'],
+        'verdict': 'REAL' if stored_data['label'] == 1 else 'FAKE',
+        'confidence': stored_data['confidence'],
+        'source': 'Trained Model (Fast)',
+        'status': '⚡ Fast Mode - Replaying AI Analysis'
+    }
 
 def predict_news(text):
     """Smart prediction: Use trained model first, AI only if needed"""
-    global _model_cache
-    
     # Get cached models (fast, no reload)
     models = get_models()
     
@@ -1021,7 +2275,7 @@ def predict_news(text):
     
     try:
         text_clean = preprocess_text(text)
-        text_hash = hash(text[:100])
+        signals = text_signals(text)
         text_length = len(text.strip())
         is_short_query = text_length < 200  # Short question
         
@@ -1030,65 +2284,44 @@ def predict_news(text):
             # Check if we have exact match in database
             stored_data = find_stored_analysis(text_clean)
             
-            if stored_data:
+            if not needs_ai(text, None, stored_data):
                 # Found exact match - USE FAST MODE (replay AI analysis)
                 pred = stored_data['label']
                 prob = stored_data['confidence']
                 
-                ai_explanations = get_ai_explanation(text, pred == 0, {})
+                ai_explanations = get_ai_explanation(text, pred == 0, {}, signals)
                 
-                gemini_result = {
-                    'analysis': stored_data['analysis'],
-                    'verdict': 'REAL' if pred == 1 else 'FAKE',
-                    'confidence': prob,
-                    'source': 'Trained Model (Fast)',
-                    'status': '⚡ Fast Mode - Replaying AI Analysis'
-                }
-                
-                return pred, prob, ai_explanations, [], {}, gemini_result
+                return pred, prob, ai_explanations, [], {}, replayed_analysis(stored_data)
             
             # No stored match - ALWAYS call AI for short queries
-            gemini_result = {}
-            
             # Check cache first
-            if text_hash in gemini_cache:
-                gemini_result = gemini_cache[text_hash]
-            else:
+            gemini_result = groq_cache_get(text)
+            if gemini_result is None:
                 # Call AI for short query
                 try:
                     gemini_result = search_gemini(text)
-                    gemini_cache[text_hash] = gemini_result
+                    groq_cache_put(text, gemini_result)
                     
-                    # Train model with AI's verdict
+                    # Learn from AI's verdict
                     if gemini_result.get('verdict') and gemini_result.get('confidence', 0) > 0.6:
-                        ai_label = 1 if gemini_result['verdict'] == 'REAL' else 0
-                        ai_confidence = gemini_result.get('confidence', 0.7)
-                        ai_analysis_text = gemini_result.get('analysis', 'No analysis provided')
-                        
-                        # Add to learning database with AI reasoning stored
-                        add_to_learning_database(text, ai_label, "Groq AI", ai_confidence, ai_analysis_text)
-                        
-                        # Retrain model immediately
-                        train_model()
-                        
-                        # Reload models after training
-                        _model_cache = {}
-                        models = get_models()
+                        learn_from_ai_verdict(text, gemini_result)
                         
                 except Exception as e:
                     gemini_result = {"analysis": f"AI error: {str(e)}", "status": "⏳", "verdict": "UNKNOWN"}
             
             # Use AI verdict for short queries
-            if gemini_result.get('verdict') and gemini_result.get('confidence', 0) > 0.5:
+            if gemini_result.get('verdict') in ('REAL', 'FAKE') and gemini_result.get('confidence', 0) > 0.5:
                 ai_pred = 1 if gemini_result['verdict'] == 'REAL' else 0
                 ai_confidence = gemini_result.get('confidence', 0.7)
                 pred = ai_pred
                 prob = ai_confidence
             else:
-                pred = 0
-                prob = 0.5
+                # AI unavailable or unsure - fall back to the local model
+                proba = ml_predict_proba(models, [text_clean], [text], [signals])[0]
+                pred = int(models['gb'].classes_[np.argmax(proba)])
+                prob = float(np.max(proba))
             
-            ai_explanations = get_ai_explanation(text, pred == 0, gemini_result)
+            ai_explanations = get_ai_explanation(text, pred == 0, gemini_result, signals)
             wiki_knowledge = {}
             factcheck_results = {}
             
@@ -1096,80 +2329,51 @@ def predict_news(text):
         
         # FOR LONG ARTICLES: Use ML confidence check first
         # STEP 1: Check if model is confident enough (trained on similar data)
-        X_tfidf = models['tfidf'].transform([text_clean]).toarray()
-        X_stylistic = get_stylistic_features(text)
-        X = np.hstack([X_tfidf, X_stylistic])
-        
-        meta = np.column_stack([
-            models['lr'].predict_proba(X),
-            models['rf'].predict_proba(X)
-        ])
-        
-        ml_pred = models['gb'].predict(meta)[0]
-        ml_prob = float(models['gb'].predict_proba(meta)[0][ml_pred])
+        proba = ml_predict_proba(models, [text_clean], [text], [signals])[0]
+
+        ml_pred = int(models['gb'].classes_[np.argmax(proba)])
+        ml_prob = float(np.max(proba))
         
         # SMART DETECTION: If model is confident (>75%), skip AI/Wiki (FAST MODE)
-        if ml_prob > 0.75:
-            # Try to find stored AI analysis for this text first
-            stored_data = find_stored_analysis(text_clean)
+        # Try to find stored AI analysis for this text first
+        stored_data = find_stored_analysis(text_clean) if ml_prob > 0.75 else None
+        
+        if not needs_ai(text, ml_prob, stored_data):
+            # Found exact match with stored analysis - USE FAST MODE
+            # Use the ORIGINAL AI verdict (not ML prediction)
+            pred = stored_data['label']  # Use stored label from AI
+            prob = stored_data['confidence']  # Use stored confidence from AI
             
-            if stored_data:
-                # Found exact match with stored analysis - USE FAST MODE
-                # Use the ORIGINAL AI verdict (not ML prediction)
-                pred = stored_data['label']  # Use stored label from AI
-                prob = stored_data['confidence']  # Use stored confidence from AI
-                
-                # Generate local reasoning (no AI API call)
-                ai_explanations = get_ai_explanation(text, pred == 0, {})
-                
-                gemini_result = {
-                    'analysis': stored_data['analysis'],
-                    'verdict': 'REAL' if pred == 1 else 'FAKE',
-                    'confidence': prob,
-                    'source': 'Trained Model (Fast)',
-                    'status': '⚡ Fast Mode - Replaying AI Analysis'
-                }
-                
-                return pred, prob, ai_explanations, [], {}, gemini_result
+            # Generate local reasoning (no AI API call)
+            ai_explanations = get_ai_explanation(text, pred == 0, {}, signals)
             
-            # No stored analysis found - DON'T USE FAST MODE, call AI instead
-            # (Fall through to AI mode below)
+            return pred, prob, ai_explanations, [], {}, replayed_analysis(stored_data)
+        
+        # No stored analysis found (or model unsure) - DON'T USE FAST MODE, call AI instead
         
         # STEP 2: Model not confident enough, use AI for verification
-        gemini_result = {}
+        # AI (unless cached), Wikipedia and the local checks run concurrently
+        gemini_result = groq_cache_get(text)
+        sources = {
+            'Wikipedia': lambda: search_wikipedia(text),
+            'Fact-check sites': lambda: check_factcheck_websites(text, signals),
+            'Local check': lambda: local_fact_check(text, signals)
+        }
+        if gemini_result is None:
+            sources['Groq AI'] = lambda: ask_ai(text)
+        evidence, missing_sources = gather_evidence(sources, PREDICT_DEADLINE)
         
-        # Check cache first
-        if text_hash in gemini_cache:
-            gemini_result = gemini_cache[text_hash]
-        else:
-            # Call Groq AI API (only when needed)
-            try:
-                gemini_result = search_gemini(text)
-                gemini_cache[text_hash] = gemini_result
-                
-                # Train model with AI's verdict
-                if gemini_result.get('verdict') and gemini_result.get('confidence', 0) > 0.6:
-                    ai_label = 1 if gemini_result['verdict'] == 'REAL' else 0
-                    ai_confidence = gemini_result.get('confidence', 0.7)
-                    ai_analysis_text = gemini_result.get('analysis', 'No analysis provided')
-                    
-                    # Add to learning database with AI reasoning stored
-                    add_to_learning_database(text, ai_label, "Groq AI", ai_confidence, ai_analysis_text)
-                    
-                    # Retrain model immediately
-                    train_model()
-                    
-                    # Reload models after training
-                    _model_cache = {}
-                    models = get_models()
-                    
-            except Exception as e:
-                gemini_result = {"analysis": f"AI error: {str(e)}", "status": "⏳", "verdict": "UNKNOWN"}
+        if gemini_result is None:
+            gemini_result = evidence.get('Groq AI', {})
+            
+            # Learn from AI's verdict
+            if gemini_result.get('verdict') and gemini_result.get('confidence', 0) > 0.6:
+                learn_from_ai_verdict(text, gemini_result)
         
         # STEP 3: Use AI verdict with Wikipedia/fact-check support
-        wiki_knowledge = search_wikipedia(text)
-        factcheck_results = check_factcheck_websites(text)
-        local_check = local_fact_check(text)
+        wiki_knowledge = evidence.get('Wikipedia', {})
+        factcheck_results = evidence.get('Fact-check sites', {})
+        local_check = evidence.get('Local check', {})
         
         # USE AI VERDICT AS PRIMARY (if available and confident)
         if gemini_result.get('verdict') and gemini_result.get('confidence', 0) > 0.5:
@@ -1199,64 +2403,292 @@ def predict_news(text):
         elif local_score > 0.7:
             prob = max(0.01, prob - 0.05)
         
-        ai_explanations = get_ai_explanation(text, pred == 0, wiki_knowledge)
+        ai_explanations = get_ai_explanation(text, pred == 0, wiki_knowledge, signals)
+        if missing_sources:
+            ai_explanations.append(f"  ⏳ No answer in time from: {', '.join(sorted(missing_sources))}")
         
-        indicators = []
-        if '!!!' in text:
-            indicators.append("Multiple !!!")
-        if 'URGENT' in text.upper():
-            indicators.append("Urgency")
+        indicators = signal_indicators(signals)
         
         # Return with AI result as primary source
-        return pred, prob, ai_explanations, indicators, wiki_knowledge, (gemini_result or factcheck_results or local_check)
+        primary = dict(gemini_result or factcheck_results or local_check)
+        primary['missing_sources'] = sorted(missing_sources)
+        return pred, prob, ai_explanations, indicators, wiki_knowledge, primary
     except Exception as e:
         return None, 0.5, [f"Error: {str(e)}"], [], {}, {"analysis": "Error occurred", "status": "❌"}
 
+# ======================== BATCH PREDICTION ========================
+def ensemble_predict_proba(models, X):
+    """Run the stacked LR/RF -> GB ensemble on a feature matrix (all rows at once)"""
+    meta = np.column_stack([
+        models['lr'].predict_proba(X),
+        models['rf'].predict_proba(X)
+    ])
+    return models['gb'].predict_proba(meta)
+
+def ml_predict_proba(models, texts_clean, texts, signals=None):
+    """Ensemble probabilities, blended with the online model once it has learned new samples"""
+    X_stylistic = stylistic_matrix(texts, signals)
+    proba = ensemble_predict_proba(models, build_feature_matrix(models['tfidf'], texts_clean, texts, X_stylistic))
+
+    online = get_online_model()
+    if online is not None and online['updates'] > 0:
+        online_proba = online['clf'].predict_proba(
+            build_feature_matrix(online['vectorizer'], texts_clean, texts, X_stylistic))
+        proba = (1 - ONLINE_MODEL_WEIGHT) * proba + ONLINE_MODEL_WEIGHT * online_proba
+
+    return proba
+
+def predict_news_batch(texts, use_ai=False):
+    """
+    Score many texts in one vectorized pass
+    - One TF-IDF transform and one predict_proba per model for the whole batch
+    - ML ensemble only, unless use_ai: then texts go through predict_news' gate (needs_ai) -
+      stored AI analyses are replayed and the rest are checked with batched Groq requests.
+      Wikipedia is not consulted, so probabilities can differ slightly from predict_news
+    - Returns one predict_news-style tuple per text, in input order
+    """
+    texts = list(texts)
+    if not texts:
+        return []
+
+    models = get_models()
+
+    if models is None:
+        return [(None, 0.5, ["❌ Model not trained yet. Click 🧠 RETRAIN NEURAL to train the model."], [], {}, {})
+                for _ in texts]
+
+    try:
+        texts_clean = [preprocess_text(t) for t in texts]
+        signals = [text_signals(t) for t in texts]
+        proba = ml_predict_proba(models, texts_clean, texts, signals)
+        classes = models['gb'].classes_
+    except Exception as e:
+        return [(None, 0.5, [f"Error: {str(e)}"], [], {}, {"analysis": "Error occurred", "status": "❌"})
+                for _ in texts]
+
+    ai_results = {}
+    replays = {}
+    if use_ai:
+        wanted = []
+        for i, (text, row) in enumerate(zip(texts, proba)):
+            ml_prob = float(np.max(row))
+            stored_data = find_stored_analysis(texts_clean[i]) if len(text.strip()) < 200 or ml_prob > 0.75 else None
+            if needs_ai(text, ml_prob, stored_data):
+                wanted.append(i)
+            else:
+                replays[i] = stored_data
+        for i in wanted:
+            # A single-prompt answer (predict_news) is preferred over a batched one
+            cached = groq_cache_get(texts[i], accept_batched=True)
+            if cached is not None:
+                ai_results[i] = cached
+        misses = [i for i in wanted if i not in ai_results]
+        try:
+            for i, result in zip(misses, search_gemini_batch([texts[i] for i in misses])):
+                groq_cache_put(texts[i], result, batched=result.get('source') == GROQ_BATCH_SOURCE)
+                ai_results[i] = result
+        except:
+            pass  # AI unavailable - the rest keep the ML verdict
+
+    results = []
+    for i, (text, row) in enumerate(zip(texts, proba)):
+        if i in replays:
+            # Stored AI analysis, exactly as predict_news replays it
+            pred, prob = replays[i]['label'], replays[i]['confidence']
+            results.append((pred, prob, get_ai_explanation(text, pred == 0, {}, signals[i]), [], {},
+                            replayed_analysis(replays[i])))
+            continue
+
+        best = int(np.argmax(row))
+        pred = int(classes[best])
+        prob = float(row[best])
+
+        # AI verdict wins when confident (boosted if the ML model agrees)
+        ai_result = ai_results.get(i, {})
+        if ai_result.get('verdict') in ('REAL', 'FAKE') and ai_result.get('confidence', 0) > 0.5:
+            ai_pred = 1 if ai_result['verdict'] == 'REAL' else 0
+            prob = ai_result['confidence'] if ai_pred != pred else min(0.99, ai_result['confidence'] + 0.05)
+            pred = ai_pred
+        else:
+            ai_result = {}
+
+        # Same local adjustments as the ML fallback in predict_news
+        local_check = local_fact_check(text, signals[i])
+        local_score = local_check.get('score', 0.5)
+        if local_score < 0.3:
+            prob = min(0.99, prob + 0.1)
+        elif local_score > 0.7:
+            prob = max(0.01, prob - 0.05)
+
+        ai_explanations = get_ai_explanation(text, pred == 0, {}, signals[i])
+
+        indicators = signal_indicators(signals[i])
+
+        batch_result = {
+            'analysis': ai_result.get('analysis') or local_check['analysis'],
+            'verdict': 'REAL' if pred == 1 else 'FAKE',
+            'confidence': prob,
+            'source': ai_result.get('source', 'Trained Model (Batch)'),
+            'status': '⚡ Batch Mode',
+            'findings': check_factcheck_websites(text, signals[i])['findings']
+        }
+
+        results.append((pred, prob, ai_explanations, indicators, {}, batch_result))
+
+    return results
+
+
+# ======================== ONLINE LEARNING ========================
+# 'incremental': fold each new AI verdict into the online model (milliseconds)
+# 'full': retrain the whole ensemble after every AI verdict
+LEARNING_MODE = os.getenv('FAKE_NEWS_LEARNING_MODE', 'incremental')
+# Seconds between automatic full rebuilds in incremental mode (0 = only on demand)
+FULL_RETRAIN_INTERVAL = int(os.getenv('FAKE_NEWS_FULL_RETRAIN_INTERVAL', '0'))
+# Share of the online model in the final probability once it has new samples
+ONLINE_MODEL_WEIGHT = 0.5
+
+_online_model = {}
+_online_lock = threading.Lock()
+
+def new_online_model():
+    """Hashing features (no vocabulary to refit) + linear model with partial_fit"""
+    return {
+        'vectorizer': HashingVectorizer(n_features=2**18, alternate_sign=False),
+        'clf': SGDClassifier(loss='log_loss', alpha=1e-5),
+        'updates': 0  # Samples learned since the last full rebuild
+    }
+
+def get_online_model():
+    """Load the online model once and cache it (None until first trained)"""
+    global _online_model
+
+    if _online_model:
+        return _online_model
+
+    if not os.path.exists('models/online.joblib'):
+        return None
+
+    try:
+        _online_model = joblib.load('models/online.joblib')
+        return _online_model
+    except:
+        return None
+
+def fit_online_model(texts, texts_clean, labels, X_stylistic=None):
+    """Rebuild the online model from scratch (part of every full train)"""
+    global _online_model
+
+    model = new_online_model()
+    X = build_feature_matrix(model['vectorizer'], texts_clean, texts, X_stylistic)
+    for _ in range(5):  # A few passes so it starts close to the batch fit
+        model['clf'].partial_fit(X, labels, classes=[0, 1])
+
+    with _online_lock:
+        dump_atomic(model, 'models/online.joblib')
+        _online_model = model
+
+def seed_online_model():
+    """
+    Fit the online model on the whole training set (when online.joblib is missing or unreadable)
+    Runs on the retrain worker: retrain_scheduler.request(online_only=True)
+    """
+    texts, labels = load_training_set()
+    if len(texts) < 2 or len(set(labels)) < 2:
+        return False
+    texts_clean, X_stylistic = prepare_training_texts(texts)
+    os.makedirs('models', exist_ok=True)
+    fit_online_model(texts, texts_clean, labels, X_stylistic)
+    return True
+
+def learn_incremental(text, label):
+    """Fold one labeled sample into the online model - no full retrain"""
+    global _online_model
+
+    # Never blend in a model that has only seen this one sample. Seeding preprocesses the whole
+    # database, so it runs on the retrain worker; predictions use the batch model until then
+    # (the sample is already stored, so the seed includes it)
+    if get_online_model() is None:
+        retrain_scheduler.request(online_only=True)
+        return
+
+    with _online_lock:
+        model = get_online_model()
+        X = build_feature_matrix(model['vectorizer'], [preprocess_text(text)], [text])
+        # Predictions keep reading the current classifier; the updated copy is swapped in
+        clf = copy.deepcopy(model['clf'])
+        clf.partial_fit(X, [label], classes=[0, 1])
+        updated = dict(model, clf=clf, updates=model['updates'] + 1)
+
+        os.makedirs('models', exist_ok=True)
+        dump_atomic(updated, 'models/online.joblib')
+        _online_model = updated
+
+    if full_retrain_due():
+        retrain_scheduler.request()
+
+def full_retrain_due():
+    """True when the scheduled full rebuild interval has passed"""
+    if not FULL_RETRAIN_INTERVAL:
+        return False
+    try:
+        return time.time() - os.path.getmtime('models/model.joblib') >= FULL_RETRAIN_INTERVAL
+    except OSError:
+        return True
+
+def learn_from_ai_verdict(text, gemini_result):
+    """Store a confident AI verdict and learn from it"""
+    ai_label = 1 if gemini_result['verdict'] == 'REAL' else 0
+    ai_confidence = gemini_result.get('confidence', 0.7)
+    ai_analysis_text = gemini_result.get('analysis', 'No analysis provided')
+
+    # Add to learning database with AI reasoning stored
+    add_to_learning_database(text, ai_label, "Groq AI", ai_confidence, ai_analysis_text)
+
+    if LEARNING_MODE == 'full':
+        # Rebuild in the background; the new model is swapped in when ready
+        retrain_scheduler.request()
+    else:
+        learn_incremental(text, ai_label)
 
 # ======================== TRAINING ========================
-def train_model():
-    """Train model with learning database"""
+# TF-IDF vocabulary size (features stay sparse, so large values are fine)
+TFIDF_MAX_FEATURES = int(os.getenv('FAKE_NEWS_TFIDF_MAX_FEATURES', '1000'))
+
+def dump_atomic(obj, path):
+    """Write a joblib artifact to a temp file and rename it into place"""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    joblib.dump(obj, tmp_path)
+    os.replace(tmp_path, path)
+
+def load_training_set():
+    """Seed samples + confident learning-database items -> (texts, labels)"""
     texts = TRUE_SAMPLES + FAKE_SAMPLES
     labels = [1] * len(TRUE_SAMPLES) + [0] * len(FAKE_SAMPLES)
     
-    # Load database - handle both old and new formats
-    db_raw = load_learning_database()
-    
-    # Handle new format (list of dicts)
-    if isinstance(db_raw, list):
-        for sample in db_raw:
-            if isinstance(sample, dict):
-                text = sample.get('text', '')
-                label = sample.get('label', 1)
-                confidence = sample.get('confidence', 0.5)
-                if text and confidence > 0.5:
-                    texts.append(text)
-                    labels.append(label)
-    # Handle old format (dict with 'real' and 'fake' keys)
-    elif isinstance(db_raw, dict):
-        for sample in db_raw.get('real', []):
-            if isinstance(sample, dict):
-                text = sample.get('text', '')
-                if text and sample.get('confidence', 0) > 0.75:
-                    texts.append(text)
-                    labels.append(1)
-        for sample in db_raw.get('fake', []):
-            if isinstance(sample, dict):
-                text = sample.get('text', '')
-                if text and sample.get('confidence', 0) > 0.75:
-                    texts.append(text)
-                    labels.append(0)
+    # Load database (legacy JSON formats are migrated by the storage layer)
+    for sample in load_learning_database():
+        text = sample.get('text', '')
+        label = sample.get('label', 1)
+        confidence = sample.get('confidence') or 0.5
+        if text and label in (0, 1) and confidence > 0.5:
+            texts.append(text)
+            labels.append(label)
+    
+    return texts, labels
+
+def train_model():
+    """Train model with learning database (prefer retrain_scheduler.request())"""
+    global _model_cache
     
+    texts, labels = load_training_set()
     if len(texts) < 2 or len(set(labels)) < 2:
         return False
     
-    texts_clean = [preprocess_text(t) for t in texts]
-    
-    tfidf = TfidfVectorizer(max_features=1000)
-    X_tfidf = tfidf.fit_transform(texts_clean).toarray()
+    texts_clean, X_stylistic = prepare_training_texts(texts)
     
-    X_stylistic = np.vstack([get_stylistic_features(t) for t in texts])
-    X = np.hstack([X_tfidf, X_stylistic])
+    # Sparse end-to-end: memory grows with non-zeros, not vocabulary x samples
+    tfidf = TfidfVectorizer(max_features=TFIDF_MAX_FEATURES)
+    X = stack_features(tfidf.fit_transform(texts_clean), texts, X_stylistic)
     
     X_train, X_test, y_train, y_test = train_test_split(X, labels, test_size=0.3)
     
@@ -1271,10 +2703,87 @@ def train_model():
     gb.fit(meta_train, y_train)
     
     os.makedirs('models', exist_ok=True)
-    joblib.dump({'tfidf': tfidf, 'lr': lr, 'rf': rf, 'gb': gb}, 'models/model.joblib')
+    version = datetime.now().strftime("%Y%m%d-%H%M%S")
+    models = {'tfidf': tfidf, 'lr': lr, 'rf': rf, 'gb': gb, 'version': version}
+    dump_atomic(models, 'models/model.joblib')
+    
+    # Reset the online learner to the same data (its update count starts at 0)
+    fit_online_model(texts, texts_clean, labels, X_stylistic)
+    
+    # Hot swap: in-flight predictions keep the dict they already hold
+    _model_cache = models
     
     return True
 
+# ======================== RETRAIN SCHEDULER ========================
+# Retrain requests closer together than this are merged into one rebuild
+RETRAIN_DEBOUNCE_SECONDS = float(os.getenv('FAKE_NEWS_RETRAIN_DEBOUNCE', '2'))
+
+class RetrainScheduler:
+    """
+    Single entry point for model rebuilds
+    - Requests inside the debounce window are coalesced into one train_model()
+    - online_only requests just seed the online model (a full rebuild covers them too)
+    - Training runs on one background worker, never two at once
+    - Callers may wait for the rebuild that covers their request
+    """
+
+    def __init__(self, debounce=RETRAIN_DEBOUNCE_SECONDS):
+        self.debounce = debounce
+        self._cond = threading.Condition()
+        self._requested = 0  # Ticket of the newest request
+        self._completed = 0  # Newest ticket covered by a finished rebuild
+        self._due = None     # When the pending rebuild starts (monotonic)
+        self._full = False   # Pending rebuild includes the ensemble (else online model only)
+        self._last_result = None
+        self._worker = None
+
+    def request(self, wait=False, immediate=False, timeout=None, online_only=False):
+        """Ask for a rebuild; with wait=True, block until it finished (returns train_model's result)"""
+        with self._cond:
+            self._requested += 1
+            ticket = self._requested
+            if not online_only:
+                self._full = True
+
+            due = time.monotonic() + (0 if immediate else self.debounce)
+            if self._due is None or due < self._due:
+                self._due = due
+
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            self._cond.notify_all()
+
+            if wait:
+                self._cond.wait_for(lambda: self._completed >= ticket, timeout)
+                return self._last_result
+        return None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._due is None:
+                    self._cond.wait()
+                while self._due - time.monotonic() > 0:
+                    self._cond.wait(self._due - time.monotonic())
+                ticket = self._requested
+                full, self._full = self._full, False
+                self._due = None
+
+            try:
+                result = train_model() if full else seed_online_model()
+            except Exception as e:
+                print(f"⚠️ Retrain failed: {e}")
+                result = False
+
+            with self._cond:
+                self._completed = ticket
+                self._last_result = result
+                self._cond.notify_all()
+
+retrain_scheduler = RetrainScheduler()
+
 # ======================== UI ========================
 class App:
     def __init__(self):
@@ -1329,7 +2838,7 @@ class App:
         """Train model in background - non-blocking"""
         try:
             if not os.path.exists('models/model.joblib'):
-                train_model()
+                retrain_scheduler.request(immediate=True)
         except:
             pass
     
@@ -1864,7 +3373,7 @@ class App:
                     self.progress.set(i/100)
                     time.sleep(0.1)
                 
-                train_model()
+                retrain_scheduler.request(wait=True, immediate=True)
                 
                 stats = get_learning_stats()
                 
@@ -1984,6 +3493,7 @@ class App:
                 result_text += f"  Real Samples: {stats['real_samples']}\n"
                 result_text += f"  Fake Samples: {stats['fake_samples']}\n"
                 result_text += f"  Total Samples: {stats['total_samples']}\n"
+                result_text += f"  Feeds Tracked: {len(stats['feed_cursors'])}\n"
                 result_text += "=" * 50 + "\n"
                 result_text += "🧠 ML Models Retrained:\n"
                 result_text += "  ✓ Logistic Regression\n"
@@ -2061,37 +3571,8 @@ class App:
         # Load data in background thread
         def load_data():
             try:
-                # Load database file
-                if not os.path.exists('learning_db.json'):
-                    with open('learning_db.json', 'w') as f:
-                        json.dump([], f)
-                
-                with open('learning_db.json', 'r', encoding='utf-8') as f:
-                    try:
-                        db_data = json.load(f)
-                    except:
-                        db_data = []
-                
-                # Ensure db_data is list
-                if not isinstance(db_data, list):
-                    db_data = []
-                
-                # Clean data and attach original indices so updates/deletes map correctly
-                cleaned_data = []
-                for i, item in enumerate(db_data):
-                    if isinstance(item, dict):
-                        d = item.copy()
-                        d['__orig_index'] = i
-                        cleaned_data.append(d)
-                    elif isinstance(item, str):
-                        cleaned_data.append({
-                            'text': item,
-                            'label': 1,
-                            'source': 'Converted',
-                            'confidence': 0.5,
-                            '__orig_index': i
-                        })
-                db_data = cleaned_data
+                # Load database (each item carries its row 'id' so updates/deletes map correctly)
+                db_data = load_learning_database()
                 
                 # Call UI update on main thread
                 db_window.after(0, lambda: self._populate_database_window(db_window, db_data, loading_label))
@@ -2243,7 +3724,6 @@ class App:
                     text_short = item.get('text', '')[:100]
                     label_val = item.get('label', 1)
                     source = item.get('source', 'Manual Entry')
-                    orig_index = item.get('__orig_index', idx)
                     
                     status_text = '✅ REAL' if label_val == 1 else '🚨 FAKE'
                     
@@ -2263,7 +3743,7 @@ class App:
                     if not isinstance(item, dict):
                         return
                     
-                    orig_index = item.get('__orig_index', row_idx)
+                    item_id = item.get('id')
                     label_val = item.get('label', 1)
                     
                     # Create action window
@@ -2286,70 +3766,31 @@ class App:
                     
                     def mark_real():
                         try:
-                            with open('learning_db.json', 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            cleaned = []
-                            for i, d in enumerate(data):
-                                if isinstance(d, dict):
-                                    cleaned.append(d)
-                                elif isinstance(d, str):
-                                    cleaned.append({'text': d, 'label': 1, 'source': 'Converted'})
-                            
-                            if orig_index < len(cleaned):
-                                cleaned[orig_index]['label'] = 1
-                                with open('learning_db.json', 'w', encoding='utf-8') as f:
-                                    json.dump(cleaned, f, indent=2, ensure_ascii=False)
-                                messagebox.showinfo("Success", "Marked as REAL")
-                                action_win.destroy()
-                                db_window.destroy()
-                                self.view_database()
+                            update_learning_label(item_id, 1)
+                            messagebox.showinfo("Success", "Marked as REAL")
+                            action_win.destroy()
+                            db_window.destroy()
+                            self.view_database()
                         except Exception as e:
                             messagebox.showerror("Error", str(e))
                     
                     def mark_fake():
                         try:
-                            with open('learning_db.json', 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            cleaned = []
-                            for i, d in enumerate(data):
-                                if isinstance(d, dict):
-                                    cleaned.append(d)
-                                elif isinstance(d, str):
-                                    cleaned.append({'text': d, 'label': 1, 'source': 'Converted'})
-                            
-                            if orig_index < len(cleaned):
-                                cleaned[orig_index]['label'] = 0
-                                with open('learning_db.json', 'w', encoding='utf-8') as f:
-                                    json.dump(cleaned, f, indent=2, ensure_ascii=False)
-                                messagebox.showinfo("Success", "Marked as FAKE")
-                                action_win.destroy()
-                                db_window.destroy()
-                                self.view_database()
+                            update_learning_label(item_id, 0)
+                            messagebox.showinfo("Success", "Marked as FAKE")
+                            action_win.destroy()
+                            db_window.destroy()
+                            self.view_database()
                         except Exception as e:
                             messagebox.showerror("Error", str(e))
                     
                     def delete_item_fn():
                         try:
-                            with open('learning_db.json', 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                            
-                            cleaned = []
-                            for i, d in enumerate(data):
-                                if isinstance(d, dict):
-                                    cleaned.append(d)
-                                elif isinstance(d, str):
-                                    cleaned.append({'text': d, 'label': 1, 'source': 'Converted'})
-                            
-                            if orig_index < len(cleaned):
-                                cleaned.pop(orig_index)
-                                with open('learning_db.json', 'w', encoding='utf-8') as f:
-                                    json.dump(cleaned, f, indent=2, ensure_ascii=False)
-                                messagebox.showinfo("Success", "Item deleted!")
-                                action_win.destroy()
-                                db_window.destroy()
-                                self.view_database()
+                            delete_learning_item(item_id)
+                            messagebox.showinfo("Success", "Item deleted!")
+                            action_win.destroy()
+                            db_window.destroy()
+                            self.view_database()
                         except Exception as e:
                             messagebox.showerror("Error", str(e))
                     
@@ -2377,11 +3818,6 @@ class App:
                     # Reload database
                     db_data_new = load_learning_database()
                     
-                    # Add index tracking
-                    for idx, item in enumerate(db_data_new):
-                        if isinstance(item, dict):
-                            item['__orig_index'] = idx
-                    
                     # Repopulate tree
                     for idx, item in enumerate(db_data_new):
                         if not isinstance(item, dict):
@@ -2416,7 +3852,7 @@ class App:
                     
                     row_idx = int(row_id.split('_')[1])
                     item = db_data[row_idx]
-                    orig_index = item.get('__orig_index', row_idx)
+                    item_id = item.get('id')
                     
                     def quick_delete():
                         # Show confirm dialog (stays on top)
@@ -2425,31 +3861,17 @@ class App:
                                                      parent=db_window)
                         if result:
                             try:
-                                with open('learning_db.json', 'r', encoding='utf-8') as f:
-                                    data = json.load(f)
+                                deleted_text = item.get('text', '')[:50]
+                                delete_learning_item(item_id)
                                 
-                                cleaned = []
-                                for i, d in enumerate(data):
-                                    if isinstance(d, dict):
-                                        cleaned.append(d)
-                                    elif isinstance(d, str):
-                                        cleaned.append({'text': d, 'label': 1, 'source': 'Converted'})
+                                # Show success popup
+                                messagebox.showinfo("Deleted Successfully", 
+                                                   f"Item deleted:\n{deleted_text}...",
+                                                   parent=db_window)
+                                
+                                # Refresh tree without closing window
+                                refresh_tree()
                                 
-                                if orig_index < len(cleaned):
-                                    deleted_text = cleaned[orig_index].get('text', '')[:50]
-                                    cleaned.pop(orig_index)
-                                    
-                                    with open('learning_db.json', 'w', encoding='utf-8') as f:
-                                        json.dump(cleaned, f, indent=2, ensure_ascii=False)
-                                    
-                                    # Show success popup
-                                    messagebox.showinfo("Deleted Successfully", 
-                                                       f"Item deleted:\n{deleted_text}...",
-                                                       parent=db_window)
-                                    
-                                    # Refresh tree without closing window
-                                    refresh_tree()
-                                    
                             except Exception as e:
                                 messagebox.showerror("Error", str(e), parent=db_window)
                     
@@ -2627,31 +4049,14 @@ class App:
                     return
                 
                 try:
-                    # Load existing data
-                    db_data_local = []
-                    if os.path.exists('learning_db.json'):
-                        try:
-                            with open('learning_db.json', 'r', encoding='utf-8') as f:
-                                loaded_data = json.load(f)
-                            
-                            if isinstance(loaded_data, list):
-                                db_data_local = loaded_data
-                        except:
-                            db_data_local = []
-                    
                     # Add new entry
-                    new_entry = {
-                        'text': text,
-                        'label': label_type,
-                        'source': source,
-                        'confidence': 1.0,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    db_data_local.append(new_entry)
-                    
-                    # Save
-                    with open('learning_db.json', 'w', encoding='utf-8') as f:
-                        json.dump(db_data_local, f, indent=2, ensure_ascii=False)
+                    if not add_manual_entry(text, label_type, source):
+                        self.show_notification(
+                            "⚠️ Duplicate",
+                            "This text is already in the learning database - nothing was added.",
+                            "warning"
+                        )
+                        return
                     
                     # Show notification
                     self.show_notification(
@@ -2714,37 +4119,10 @@ class App:
                     return
                 
                 try:
-                    # Load existing data - ensure it's a list
-                    db_data = []
-                    if os.path.exists('learning_db.json'):
-                        try:
-                            with open('learning_db.json', 'r', encoding='utf-8') as f:
-                                loaded_data = json.load(f)
-                            
-                            # Make sure loaded_data is a list
-                            if isinstance(loaded_data, list):
-                                db_data = loaded_data
-                            elif isinstance(loaded_data, dict):
-                                # If it's a dict, try to convert to list
-                                db_data = []
-                            else:
-                                db_data = []
-                        except:
-                            db_data = []
-                    
                     # Add new entry
-                    new_entry = {
-                        'text': text,
-                        'label': label_type,
-                        'source': source,
-                        'confidence': 1.0,
-                        'timestamp': datetime.now().isoformat()
-                    }
-                    db_data.append(new_entry)
-                    
-                    # Save - ensure we're saving a list
-                    with open('learning_db.json', 'w', encoding='utf-8') as f:
-                        json.dump(db_data, f, indent=2, ensure_ascii=False)
+                    if not add_manual_entry(text, label_type, source):
+                        messagebox.showwarning("Duplicate", "This text is already in the learning database - nothing was added.")
+                        return
                     
                     messagebox.showinfo("Success", f"Added as {'REAL' if label_type == 1 else 'FAKE'} news!")
                     entry_window.destroy()
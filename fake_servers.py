@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧪 Local Stand-in Servers for Groq, Wikipedia and RSS
+Serves synthetic fixtures from benchmarks/fixtures so the network paths
+(search_gemini, search_wikipedia, fetch_live_news, mega training) can be
+measured and load-tested without internet access or an API key.
+
+Usage:
+    python fake_servers.py --port 8765
+    python fake_servers.py --latency 200 --jitter 0.5 --error-rate 0.05 --rate-limit-rate 0.2
+
+Then point the app at it:
+    FAKE_NEWS_GROQ_URL=http://127.0.0.1:8765/openai/v1/chat/completions
+    FAKE_NEWS_WIKI_URL=http://127.0.0.1:8765/w/api.php
+    FAKE_NEWS_FEED_BASE_URL=http://127.0.0.1:8765
+
+Routes:
+    POST .../chat/completions   Canned verdicts, single and numbered (batched) prompts
+    GET  /w/api.php             action=query&prop=extracts with normalized titles and redirects
+    GET  /<host>/<path>         RSS fixture for the feed's host (ETag / If-None-Match -> 304)
+    GET  /__stats               Request counters (JSON)
+
+Injected faults apply to every route except /__stats and are seeded (--seed)
+so runs are reproducible.
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmarks', 'fixtures')
+
+# Feed hosts -> fixture feed (anything else gets one picked by path hash)
+FEED_FIXTURES = {
+    'bbc': 'bbc_world.xml',
+    'aljazeera': 'aljazeera_all.xml',
+    'npr': 'npr_news.xml',
+    'guardian': 'guardian_world.xml',
+}
+
+_CLAIM_RE = re.compile(r'^CLAIM (\d+): (.*)$', re.MULTILINE)
+_QUESTION_RE = re.compile(r'^(?:Question|News Text): (.*)$', re.MULTILINE)
+
+
+class FaultInjector:
+    """Latency, 5xx and 429 injection (one seeded RNG shared by all handler threads)"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit_rate=0.0, retry_after=1, seed=42):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def draw(self):
+        """(delay seconds, fault) where fault is None, 429 or 503"""
+        with self.lock:
+            delay = self.latency * (1 + self.jitter * (2 * self.rng.random() - 1))
+            roll = self.rng.random()
+        if roll < self.rate_limit_rate:
+            return max(delay, 0), 429
+        if roll < self.rate_limit_rate + self.error_rate:
+            return max(delay, 0), 503
+        return max(delay, 0), None
+
+
+class Fixtures:
+    """Fixture responses, loaded once"""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, 'groq_completions.json'), 'r', encoding='utf-8') as f:
+            self.answers = json.load(f)['answers']
+        with open(os.path.join(directory, 'wikipedia_intros.json'), 'r', encoding='utf-8') as f:
+            wiki = json.load(f)
+        self.pages = wiki['pages']
+        self.redirects = wiki['redirects']
+        self.feeds = {}
+        for name in sorted(os.listdir(directory)):
+            if name.endswith('.xml'):
+                with open(os.path.join(directory, name), 'rb') as f:
+                    content = f.read()
+                self.feeds[name] = (content, f'"{zlib.crc32(content):08x}"')
+
+    def answer_for(self, claim):
+        """Stable canned answer for a claim"""
+        return self.answers[zlib.crc32(claim.encode('utf-8')) % len(self.answers)]
+
+    def feed_for(self, path):
+        """(content, etag) of the fixture serving /<host>/<path>"""
+        host = path.lstrip('/').split('/', 1)[0]
+        for keyword, name in FEED_FIXTURES.items():
+            if keyword in host and name in self.feeds:
+                return self.feeds[name]
+        names = sorted(self.feeds)
+        return self.feeds[names[zlib.crc32(path.encode('utf-8')) % len(names)]]
+
+
+def format_answer(answer):
+    return f"VERDICT: {answer['verdict']}\nCONFIDENCE: {answer['confidence']}%\nREASONING: {answer['reasoning']}"
+
+
+def chat_completion(fixtures, payload):
+    """OpenAI-style chat completion for the app's single and batched prompts"""
+    prompt = payload['messages'][-1]['content']
+    claims = _CLAIM_RE.findall(prompt)
+    if claims:
+        content = '\n\n'.join(f"CLAIM {number}\n{format_answer(fixtures.answer_for(claim))}"
+                              for number, claim in claims)
+    else:
+        question = _QUESTION_RE.search(prompt)
+        content = format_answer(fixtures.answer_for(question.group(1) if question else prompt))
+
+    prompt_tokens = sum(len(m['content']) for m in payload['messages']) // 4 + 1
+    completion_tokens = len(content) // 4 + 1
+    return {
+        'id': f"chatcmpl-fake-{zlib.crc32(prompt.encode('utf-8')):08x}",
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': payload.get('model', 'fake'),
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': completion_tokens,
+                  'total_tokens': prompt_tokens + completion_tokens}
+    }
+
+
+def wikipedia_query(fixtures, params):
+    """action=query&prop=extracts response shaped like the MediaWiki API"""
+    titles = [t for t in params.get('titles', [''])[0].split('|') if t]
+    query = {'pages': {}}
+    normalized, redirects = [], []
+    missing_id = -1
+    for title in titles:
+        target = title[:1].upper() + title[1:]
+        if target != title:
+            normalized.append({'from': title, 'to': target})
+        if target in fixtures.redirects:
+            redirects.append({'from': target, 'to': fixtures.redirects[target]})
+            target = fixtures.redirects[target]
+        if target in fixtures.pages:
+            page_id = zlib.crc32(target.encode('utf-8'))
+            query['pages'][str(page_id)] = {'pageid': page_id, 'ns': 0, 'title': target,
+                                            'extract': fixtures.pages[target]}
+        else:
+            query['pages'][str(missing_id)] = {'ns': 0, 'title': target, 'missing': ''}
+            missing_id -= 1
+    if normalized:
+        query['normalized'] = normalized
+    if redirects:
+        query['redirects'] = redirects
+    return {'batchcomplete': '', 'query': query}
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real services
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def count(self, key):
+        with self.server.stats_lock:
+            self.server.stats[key] = self.server.stats.get(key, 0) + 1
+
+    def send_body(self, status, body, content_type='application/json', headers=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def inject_fault(self, route):
+        """Sleep the injected latency; True if a fault response was sent instead"""
+        delay, fault = self.server.faults.draw()
+        if delay:
+            time.sleep(delay)
+        if fault == 429:
+            self.count(f'{route}_429')
+            self.send_body(429, {'error': {'message': 'Rate limit reached (injected)', 'type': 'rate_limit'}},
+                           headers={'Retry-After': str(self.server.faults.retry_after)})
+            return True
+        if fault == 503:
+            self.count(f'{route}_503')
+            self.send_body(503, {'error': {'message': 'Service unavailable (injected)'}})
+            return True
+        return False
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length)
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.send_body(404, {'error': {'message': 'Unknown route'}})
+            return
+        self.count('groq')
+        if self.inject_fault('groq'):
+            return
+        try:
+            payload = json.loads(body)
+            response = chat_completion(self.server.fixtures, payload)
+        except (ValueError, KeyError, IndexError, TypeError):
+            self.send_body(400, {'error': {'message': 'Malformed chat completion request'}})
+            return
+        self.send_body(200, response)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path == '/__stats':
+            with self.server.stats_lock:
+                self.send_body(200, dict(self.server.stats))
+            return
+
+        if parsed.path.endswith('/api.php'):
+            self.count('wikipedia')
+            if self.inject_fault('wikipedia'):
+                return
+            self.send_body(200, wikipedia_query(self.server.fixtures, parse_qs(parsed.query)))
+            return
+
+        self.count('feed')
+        if self.inject_fault('feed'):
+            return
+        content, etag = self.server.fixtures.feed_for(parsed.path)
+        if self.headers.get('If-None-Match') == etag:
+            self.count('feed_304')
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_body(200, content, 'application/rss+xml; charset=utf-8', {'ETag': etag})
+
+    do_HEAD = do_GET
+
+
+def start_server(host='127.0.0.1', port=0, fixtures_dir=FIXTURES_DIR, verbose=False, **fault_options):
+    """
+    Start the servers on a background thread - returns (server, base_url)
+    (port 0 picks a free port; stop with server.shutdown())
+    """
+    server = ThreadingHTTPServer((host, port), FakeHandler)
+    server.daemon_threads = True
+    server.fixtures = Fixtures(fixtures_dir)
+    server.faults = FaultInjector(**fault_options)
+    server.stats = {}
+    server.stats_lock = threading.Lock()
+    server.verbose = verbose
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in servers for Groq, Wikipedia and RSS feeds")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="Fixture responses (default: benchmarks/fixtures)")
+    parser.add_argument("--latency", type=float, default=0, help="Added latency per request in ms (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0, help="Latency varies by +/- this fraction (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Fraction of requests answered 503 (default: 0)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0, help="Fraction answered 429 (default: 0)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s (default: 1)")
+    parser.add_argument("--seed", type=int, default=42, help="Fault injection seed (default: 42)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log every request")
+    args = parser.parse_args()
+
+    if args.error_rate + args.rate_limit_rate > 1:
+        parser.error("--error-rate + --rate-limit-rate must be at most 1")
+
+    server, base_url = start_server(args.host, args.port, args.fixtures, args.verbose,
+                                    latency=args.latency / 1000, jitter=args.jitter, error_rate=args.error_rate,
+                                    rate_limit_rate=args.rate_limit_rate, retry_after=args.retry_after, seed=args.seed)
+
+    print(f"🧪 Fake servers on {base_url} (Ctrl+C to stop)")
+    print(f"   export FAKE_NEWS_GROQ_URL={base_url}/openai/v1/chat/completions")
+    print(f"   export FAKE_NEWS_WIKI_URL={base_url}/w/api.php")
+    print(f"   export FAKE_NEWS_FEED_BASE_URL={base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+        print(f"\nRequests: {json.dumps(server.stats, sort_keys=True)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
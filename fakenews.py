@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🛡️ Headless Fake News Detector (no UI)
+
+Usage:
+    python -m fakenews score input.jsonl > out.jsonl
+    python -m fakenews score input.csv --workers 4 --checkpoint run.ckpt -o out.jsonl
+    python -m fakenews score claims.jsonl --ai -o out.jsonl
+    python -m fakenews serve --port 8765
+
+Each output line carries the byte `offset` of its input record. If a run is
+killed, restart it with --resume-from <offset> (or the same --checkpoint file)
+and it continues from the first record that was not written yet.
+"""
+
+import argparse
+import collections
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Skip interactive API key setup / package installs in headless mode
+# (inherited by spawned worker processes through the environment)
+os.environ.setdefault("FAKE_NEWS_FAST_START", "1")
+
+# Startup banner goes to stderr so stdout stays pure JSONL
+with contextlib.redirect_stdout(sys.stderr):
+    import clean_app
+
+
+# ======================== INPUT STREAMING ========================
+def _read_csv_record(f):
+    """Read one CSV record (may span lines inside quotes) as raw bytes"""
+    raw = f.readline()
+    while raw and raw.count(b'"') % 2 == 1:
+        more = f.readline()
+        if not more:
+            break
+        raw += more
+    return raw
+
+
+def iter_records(path, fmt, start_offset=0):
+    """
+    Stream (offset, next_offset, record) from a JSONL or CSV file
+    - Reads one record at a time (memory does not grow with file size)
+    - Offsets are byte positions, so a run can resume with a seek
+    """
+    with open(path, 'rb') as f:
+        fieldnames = None
+        if fmt == 'csv':
+            header = _read_csv_record(f).decode('utf-8-sig')
+            fieldnames = next(csv.reader([header]), [])
+            start_offset = max(start_offset, f.tell())
+
+        f.seek(start_offset)
+        offset = start_offset
+
+        while True:
+            raw = _read_csv_record(f) if fmt == 'csv' else f.readline()
+            if not raw:
+                break
+            next_offset = f.tell()
+            line = raw.decode('utf-8', errors='replace')
+
+            if line.strip():
+                try:
+                    if fmt == 'csv':
+                        values = next(csv.reader(io.StringIO(line)), [])
+                        record = dict(zip(fieldnames, values))
+                    else:
+                        record = json.loads(line)
+                        if not isinstance(record, dict):
+                            record = {'text': str(record)}
+                except Exception as e:
+                    record = {'__error': f"Unreadable record: {str(e)[:80]}"}
+                yield offset, next_offset, record
+
+            offset = next_offset
+
+
+def iter_chunks(records, size):
+    """Group a record stream into lists of at most `size` items"""
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def record_text(record, text_field):
+    """Pick the text to score from an input record"""
+    text = record.get(text_field)
+    if not text:
+        # RSS-style records
+        text = f"{record.get('title', '')}. {record.get('summary', '')}".strip('. ')
+    return str(text or '')
+
+
+# ======================== WORKERS ========================
+def _init_worker(groq_share=1):
+    """Load the models once per worker process (and take a share of the Groq rate limit)"""
+    with contextlib.redirect_stdout(sys.stderr):
+        clean_app.get_models()
+    if groq_share > 1:
+        clean_app.groq_rate_limiter = clean_app.TokenBucket(
+            clean_app.GROQ_REQUESTS_PER_MINUTE / 60.0 / groq_share,
+            max(1, clean_app.GROQ_BURST // groq_share)
+        )
+
+
+def score_texts(texts, use_ai=False):
+    """Score a chunk of texts (runs inside a worker process)"""
+    results = []
+    for pred, prob, ai_explanations, indicators, _wiki, result in clean_app.predict_news_batch(texts, use_ai):
+        if pred is None:
+            results.append({'error': ai_explanations[0] if ai_explanations else 'Scoring failed'})
+            continue
+        row = {
+            'verdict': result.get('verdict'),
+            'label': pred,
+            'confidence': round(prob, 4),
+            'indicators': indicators
+        }
+        if use_ai:
+            row['source'] = result.get('source')
+        results.append(row)
+    return results
+
+
+# ======================== SCORE COMMAND ========================
+def _detect_format(path):
+    return 'csv' if path.lower().endswith('.csv') else 'jsonl'
+
+
+def _write_checkpoint(path, offset):
+    """Atomically record the next input offset to process"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump({'offset': offset}, f)
+    os.replace(tmp_path, path)
+
+
+def _read_checkpoint(path):
+    try:
+        with open(path, 'r') as f:
+            return int(json.load(f).get('offset', 0))
+    except Exception:
+        return 0
+
+
+def run_score(args):
+    fmt = args.format or _detect_format(args.input)
+    start_offset = args.resume_from
+    if start_offset is None:
+        start_offset = _read_checkpoint(args.checkpoint) if args.checkpoint else 0
+
+    if clean_app.get_models() is None:
+        print("❌ Model not trained yet. Train it from the app (🧠 RETRAIN NEURAL) first.", file=sys.stderr)
+        return 1
+
+    # Append when resuming so already written results are kept
+    if args.output == '-':
+        out = sys.stdout
+    else:
+        out = open(args.output, 'a' if start_offset else 'w', encoding='utf-8')
+
+    executor = None
+    if args.workers > 1:
+        # Spawned like the training pool: no forked copies of clean_app's SQLite connections or threads
+        executor = ProcessPoolExecutor(max_workers=args.workers, mp_context=multiprocessing.get_context('spawn'),
+                                       initializer=_init_worker, initargs=(args.workers if args.ai else 1,))
+    max_in_flight = max(1, args.workers) * 2
+    in_flight = collections.deque()
+    next_offset = start_offset
+    scored = 0
+
+    def flush_oldest():
+        """Write the oldest chunk's results (keeps output in input order)"""
+        nonlocal next_offset, scored
+        chunk, future = in_flight.popleft()
+        results = iter(future.result() if executor else future)
+        for offset, end_offset, record in chunk:
+            row = {'offset': offset}
+            if args.id_field in record:
+                row['id'] = record[args.id_field]
+            if '__error' in record:
+                row['error'] = record['__error']  # Not scored
+            else:
+                row.update(next(results))
+            out.write(json.dumps(row, ensure_ascii=False) + '\n')
+            next_offset = end_offset
+        out.flush()
+        scored += len(chunk)
+        if args.checkpoint:
+            _write_checkpoint(args.checkpoint, next_offset)
+
+    try:
+        for chunk in iter_chunks(iter_records(args.input, fmt, start_offset), args.batch_size):
+            texts = [record_text(record, args.text_field) for _, _, record in chunk if '__error' not in record]
+            if executor:
+                in_flight.append((chunk, executor.submit(score_texts, texts, args.ai)))
+            else:
+                in_flight.append((chunk, score_texts(texts, args.ai)))
+
+            # Bounded memory: never hold more than a few chunks at once
+            while len(in_flight) >= max_in_flight:
+                flush_oldest()
+
+        while in_flight:
+            flush_oldest()
+
+    except KeyboardInterrupt:
+        print(f"\n⏹️ Interrupted. Resume with --resume-from {next_offset}", file=sys.stderr)
+        return 130
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"✅ Scored {scored} records (next offset: {next_offset})", file=sys.stderr)
+    return 0
+
+
+# ======================== SCORING SERVICE ========================
+class MicroBatcher:
+    """
+    Coalesce concurrent score requests into one predict_news_batch call
+    - The first request opens a batch window of `window_ms`
+    - Requests arriving inside the window join it (up to `max_batch` texts)
+    - The model never sees more than `max_batch` texts at once (big requests are split)
+    """
+
+    def __init__(self, window_ms=5, max_batch=64):
+        self.window = window_ms / 1000.0
+        self.max_batch = max_batch
+        self.queue = queue.Queue()
+        self.batches = 0
+        self.texts_scored = 0
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def submit(self, texts):
+        """Queue texts for scoring; returns a Future with their results"""
+        future = Future()
+        self.queue.put((texts, future))
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self.queue.get()]
+            count = len(batch[0][0])
+            deadline = time.monotonic() + self.window
+
+            while count < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                count += len(item[0])
+
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                results = []
+                for start in range(0, len(texts), self.max_batch):
+                    results.extend(score_texts(texts[start:start + self.max_batch]))
+                    self.batches += 1
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.texts_scored += len(texts)
+
+            start = 0
+            for item_texts, future in batch:
+                future.set_result(results[start:start + len(item_texts)])
+                start += len(item_texts)
+
+
+class ScoreRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET  /health   -> service status
+    GET  /version  -> model version
+    POST /score    -> {"text": "..."} or {"texts": ["...", ...]}
+    """
+
+    server_version = "FakeNewsDetector/1.0"
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        batcher = self.server.batcher
+        if self.path == '/health':
+            self._send_json(200, {
+                'status': 'ok' if clean_app.get_models() is not None else 'no_model',
+                'uptime_seconds': round(time.time() - self.server.started_at, 1),
+                'batches': batcher.batches,
+                'texts_scored': batcher.texts_scored
+            })
+        elif self.path == '/version':
+            self._send_json(200, {'model_version': clean_app.get_model_version()})
+        else:
+            self._send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if self.path != '/score':
+            self._send_json(404, {'error': 'Not found'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except Exception:
+            self._send_json(400, {'error': 'Invalid JSON body'})
+            return
+
+        usage = "Send {'text': str} or {'texts': [str, ...]}"
+        if not isinstance(body, dict):
+            self._send_json(400, {'error': usage})
+            return
+        single = 'text' in body
+        texts = [body['text']] if single else body.get('texts')
+        if not isinstance(texts, list) or not texts or not all(isinstance(t, str) for t in texts):
+            self._send_json(400, {'error': usage})
+            return
+
+        try:
+            results = self.server.batcher.submit(texts).result(timeout=self.server.request_timeout)
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+
+        self._send_json(200, results[0] if single else {'results': results})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class ScoringHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # Bursts of concurrent callers are the point
+
+
+def run_serve(args):
+    # Warm everything up once so requests never pay the load cost
+    if clean_app.get_models() is None:
+        print("❌ Model not trained yet. Train it from the app (🧠 RETRAIN NEURAL) first.", file=sys.stderr)
+        return 1
+    score_texts(["Warm-up request for the scoring service"])
+
+    server = ScoringHTTPServer((args.host, args.port), ScoreRequestHandler)
+    server.batcher = MicroBatcher(window_ms=args.batch_window_ms, max_batch=args.max_batch_size)
+    server.request_timeout = args.request_timeout
+    server.started_at = time.time()
+    server.verbose = args.verbose
+
+    print(f"✅ Scoring service on http://{args.host}:{args.port} "
+          f"(model {clean_app.get_model_version()}, window {args.batch_window_ms}ms, "
+          f"max batch {args.max_batch_size})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+# ======================== MAIN ========================
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="fakenews", description="Headless Fake News Detector")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser("score", help="Score a JSONL or CSV file (results as JSONL)")
+    score.add_argument("input", help="Input .jsonl or .csv file")
+    score.add_argument("-o", "--output", default="-", help="Output JSONL file (default: stdout)")
+    score.add_argument("--format", choices=["jsonl", "csv"], help="Input format (default: from file extension)")
+    score.add_argument("--text-field", default="text", help="Field holding the article text (default: text)")
+    score.add_argument("--id-field", default="id", help="Field copied to the output as 'id' (default: id)")
+    score.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes (default: CPU count)")
+    score.add_argument("--batch-size", type=int, default=256, help="Records per scoring batch (default: 256)")
+    score.add_argument("--resume-from", type=int, help="Byte offset to resume from (see 'offset' in the output)")
+    score.add_argument("--checkpoint", help="File that tracks the resume offset across runs")
+    score.add_argument("--ai", action="store_true",
+                       help="Also check uncertain/short texts with Groq (batched requests, needs config.json)")
+    score.set_defaults(func=run_score)
+
+    serve = commands.add_parser("serve", help="Run a local HTTP scoring service with warm models")
+    serve.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    serve.add_argument("--port", type=int, default=8765, help="Port (default: 8765)")
+    serve.add_argument("--batch-window-ms", type=float, default=5, help="How long to collect requests into a batch (default: 5)")
+    serve.add_argument("--max-batch-size", type=int, default=64, help="Max texts per batch (default: 64)")
+    serve.add_argument("--request-timeout", type=float, default=30, help="Seconds before a request gives up (default: 30)")
+    serve.add_argument("--verbose", action="store_true", help="Log every request")
+    serve.set_defaults(func=run_serve)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
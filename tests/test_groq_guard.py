@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Groq guard: local rate limiting must not count against the circuit breaker.
+Run: python -m pytest tests/
+"""
+
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(BASE_DIR)
+sys.path.insert(0, BASE_DIR)
+os.environ.setdefault("FAKE_NEWS_FAST_START", "1")
+
+with contextlib.redirect_stdout(io.StringIO()):
+    import clean_app
+
+
+class LocalThrottleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.saved = (clean_app.groq_rate_limiter, clean_app.groq_breaker, clean_app._groq_api_key, clean_app.GROQ_API_URL)
+        # One token, refilled once an hour - every call after the first is throttled locally
+        clean_app.groq_rate_limiter = clean_app.TokenBucket(1 / 3600.0, 1)
+        clean_app.groq_rate_limiter.acquire()
+        clean_app.groq_breaker = clean_app.CircuitBreaker(threshold=2, cooldown=60)
+        clean_app._groq_api_key = 'test-key'
+        clean_app.GROQ_API_URL = 'http://127.0.0.1:9/never-called'
+
+    def tearDown(self):
+        (clean_app.groq_rate_limiter, clean_app.groq_breaker,
+         clean_app._groq_api_key, clean_app.GROQ_API_URL) = self.saved
+
+    def test_exhausted_bucket_keeps_breaker_closed(self):
+        for _ in range(5):
+            result = clean_app.search_gemini("Is the moon made of cheese?")
+            self.assertEqual(result['verdict'], 'UNKNOWN')
+            self.assertEqual(result['source'], 'Groq API Busy')
+        self.assertEqual(clean_app.groq_breaker.state, 'closed')
+        self.assertEqual(clean_app.groq_breaker.failures, 0)
+
+    def test_batch_throttle_keeps_breaker_closed(self):
+        self.assertIsNone(clean_app._groq_batch_request(["Claim one.", "Claim two."]))
+        self.assertEqual(clean_app.groq_breaker.state, 'closed')
+        self.assertEqual(clean_app.groq_breaker.failures, 0)
+
+    def test_throttled_trial_ends_without_a_failure(self):
+        breaker = clean_app.groq_breaker
+        breaker.failures, breaker.opened_at = 2, 0.0  # Open, cooldown long over
+        clean_app.search_gemini("Is the moon made of cheese?")
+        self.assertFalse(breaker.trial_running)
+        self.assertEqual(breaker.failures, 2)
+        self.assertTrue(breaker.allow())  # The next caller gets the trial
+
+
+if __name__ == "__main__":
+    unittest.main()